@@ -47,6 +47,123 @@ def sync_all_pilot_calendars():
     return {'synced': synced_count, 'results': results}
 
 
+# =============================================================================
+# Link OAuth credentials to an Attendee calendar (post-OAuth callback)
+# =============================================================================
+
+# Per-provider calendar settings: (deduplication key suffix, platform, calendar_type attr, fallback type)
+_OAUTH_CALENDAR_SETTINGS = {
+    'google': ('google-oauth', 'Google', 'GOOGLE_OAUTH', 1),
+    'microsoft': ('microsoft-oauth', 'Microsoft', 'MICROSOFT_OAUTH', 2),
+}
+
+
+def link_oauth_calendar_sync(credential_id: int):
+    """Synchronous version for Kubernetes mode."""
+    return _link_oauth_calendar_impl(credential_id)
+
+
+def enqueue_link_oauth_calendar_task(credential_id: int):
+    """Enqueue calendar creation + initial sync for a newly stored OAuth credential."""
+    from bots.task_executor import is_kubernetes_mode, task_executor
+    if is_kubernetes_mode():
+        task_executor.submit(link_oauth_calendar_sync, credential_id)
+    else:
+        link_oauth_calendar.delay(credential_id)
+
+
+@shared_task
+def link_oauth_calendar(credential_id: int):
+    """Create or link the Attendee calendar for an OAuth credential and trigger its first sync."""
+    return _link_oauth_calendar_impl(credential_id)
+
+
+def _link_oauth_calendar_impl(credential_id: int):
+    """
+    Get or create the calendar for an OAuth credential and link it.
+    Runs the initial sync when the calendar is new.
+    """
+    from django.db import transaction
+
+    from bots.domain_wide.models import OAuthCredential
+    from bots.tasks.sync_calendar_task import enqueue_sync_calendar_task
+
+    # One transaction for the calendar and the credential link; the row lock
+    # keeps a concurrent callback for the same user from racing the link
+    with transaction.atomic(using='default'):
+        try:
+            credential = OAuthCredential.objects.select_for_update().get(id=credential_id)
+        except OAuthCredential.DoesNotExist:
+            logger.error(f"OAuth credential {credential_id} not found for calendar linking")
+            return {'status': 'error', 'reason': 'credential not found'}
+
+        key_suffix, platform, calendar_type_attr, fallback_type = _OAUTH_CALENDAR_SETTINGS[credential.provider]
+        calendar, cal_created = Calendar.objects.get_or_create(
+            deduplication_key=f"{credential.email}-{key_suffix}",
+            defaults={
+                'platform': platform,
+                'calendar_type': getattr(Calendar, calendar_type_attr, fallback_type),
+                'state': 1,  # ACTIVE
+            }
+        )
+        if credential.calendar_id != calendar.id:
+            credential.calendar = calendar
+            credential.save(update_fields=['calendar'])
+
+    # Enqueue after commit so the sync task sees the calendar
+    if cal_created:
+        logger.info(f"Created {platform} calendar for {credential.email}")
+        # Trigger initial sync
+        enqueue_sync_calendar_task(calendar)
+
+    return {'status': 'success', 'calendar_id': calendar.id, 'created': cal_created}
+
+
+# =============================================================================
+# Google Calendar push notifications (webhook handed off after responding)
+# =============================================================================
+
+def handle_google_webhook_sync(channel_id: str):
+    """Synchronous version for Kubernetes mode."""
+    return _handle_google_webhook_impl(channel_id)
+
+
+def enqueue_google_webhook_task(channel_id: str):
+    """Enqueue the calendar lookup and sync for a Google push notification."""
+    from bots.task_executor import is_kubernetes_mode, task_executor
+    if is_kubernetes_mode():
+        task_executor.submit(handle_google_webhook_sync, channel_id)
+    else:
+        handle_google_webhook.delay(channel_id)
+
+
+@shared_task
+def handle_google_webhook(channel_id: str):
+    """Look up the calendar for a watch channel and trigger a sync."""
+    return _handle_google_webhook_impl(channel_id)
+
+
+def _handle_google_webhook_impl(channel_id: str):
+    """Look up the calendar for a watch channel and trigger a sync."""
+    from bots.domain_wide.models import GoogleWatchChannel
+    from bots.tasks.sync_calendar_task import enqueue_sync_calendar_task
+
+    watch_channel = GoogleWatchChannel.objects.select_related('calendar').filter(channel_id=channel_id).first()
+
+    if not watch_channel:
+        logger.warning(f"Unknown channel {channel_id}, ignoring webhook")
+        return {'status': 'skipped', 'reason': 'unknown channel'}
+
+    calendar = watch_channel.calendar
+    if not calendar:
+        logger.warning(f"No calendar linked to watch channel for {watch_channel.user_email}")
+        return {'status': 'skipped', 'reason': 'no calendar linked'}
+
+    logger.info(f"Triggering sync for {watch_channel.user_email} (calendar {calendar.object_id})")
+    enqueue_sync_calendar_task(calendar)
+    return {'status': 'queued', 'calendar_id': calendar.id}
+
+
 # =============================================================================
 # Sync meeting data to Supabase (fire-and-forget mirror)
 # =============================================================================
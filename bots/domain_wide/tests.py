@@ -1,6 +1,6 @@
 """Tests for domain_wide module."""
 from unittest.mock import patch, MagicMock
-from datetime import timedelta
+from datetime import datetime, timedelta, timezone as dt_timezone
 from django.test import TestCase, SimpleTestCase, RequestFactory
 from django.utils import timezone
 
@@ -143,3 +143,362 @@ class TestViews(SimpleTestCase):
         self.assertEqual(response.status_code, 200)
         # Basic structure check
         self.assertIn(b'bot_states', response.content)
+
+
+class TestKubernetesQuantityParsing(SimpleTestCase):
+    """Test Kubernetes resource quantity parsing helpers."""
+
+    def test_parse_memory_binary_suffixes(self):
+        from bots.domain_wide.views.kubernetes import _parse_memory
+        self.assertEqual(_parse_memory('512Ki'), 512 * 1024)
+        self.assertEqual(_parse_memory('256Mi'), 256 * 1024**2)
+        self.assertEqual(_parse_memory('1.5Gi'), int(1.5 * 1024**3))
+
+    def test_parse_memory_decimal_suffixes_and_plain(self):
+        from bots.domain_wide.views.kubernetes import _parse_memory
+        self.assertEqual(_parse_memory('2G'), 2 * 1000**3)
+        self.assertEqual(_parse_memory('1048576'), 1048576)
+
+    def test_parse_memory_invalid(self):
+        from bots.domain_wide.views.kubernetes import _parse_memory
+        self.assertEqual(_parse_memory(None), 0)
+        self.assertEqual(_parse_memory('3Ei'), 0)
+        self.assertEqual(_parse_memory('abcMi'), 0)
+
+
+class TestKubernetesEventsAPI(SimpleTestCase):
+    """Test KubernetesEventsAPI error isolation between event lists."""
+
+    def _event(self, event_type, reason):
+        event_time = timezone.now() - timedelta(minutes=5)
+        return MagicMock(
+            type=event_type,
+            reason=reason,
+            message=f'{reason} happened',
+            last_timestamp=event_time,
+            first_timestamp=event_time,
+            count=1,
+            involved_object=MagicMock(kind='Pod', name='bot-abc'),
+        )
+
+    @patch('bots.domain_wide.views.kubernetes._init_kubernetes_client')
+    def test_timed_out_list_does_not_fail_the_panel(self, mock_init_client):
+        """A read timeout on one list should only drop that list's events."""
+        import json
+
+        import urllib3
+
+        from bots.domain_wide.views.kubernetes import KubernetesEventsAPI
+
+        def list_namespaced_event(namespace, field_selector, **kwargs):
+            if namespace == 'attendee' and field_selector == 'type=Normal':
+                raise urllib3.exceptions.ReadTimeoutError(None, '/api/v1/events', 'Read timed out.')
+            event_type = field_selector.split('=', 1)[1]
+            return MagicMock(items=[self._event(event_type, f'{event_type}-{namespace}')])
+
+        mock_init_client.return_value.list_namespaced_event.side_effect = list_namespaced_event
+
+        request = RequestFactory().get('/dashboard/api/kubernetes/events/')
+        with self.settings(BOT_POD_NAMESPACE='attendee', WEBPAGE_STREAMER_POD_NAMESPACE='streamer'):
+            response = KubernetesEventsAPI().get(request)
+
+        self.assertEqual(response.status_code, 200)
+        data = json.loads(response.content)
+        self.assertEqual(
+            sorted(e['reason'] for e in data['warnings']),
+            ['Warning-attendee', 'Warning-streamer'],
+        )
+        self.assertEqual(
+            [e['reason'] for e in data['events'] if e['type'] == 'Normal'],
+            ['Normal-streamer'],
+        )
+        self.assertEqual(data['counts'], {'Normal': 1, 'Warning': 2})
+
+
+class TestGoogleWebhookRouting(SimpleTestCase):
+    """Test that Google push notifications are handed to the mode's task queue."""
+
+    @patch('bots.task_executor.is_kubernetes_mode', return_value=False)
+    @patch('bots.domain_wide.tasks.handle_google_webhook')
+    def test_celery_mode_enqueues_celery_task(self, mock_task, mock_k8s_mode):
+        from bots.domain_wide.tasks import enqueue_google_webhook_task
+        enqueue_google_webhook_task('channel-1')
+        mock_task.delay.assert_called_once_with('channel-1')
+
+    @patch('bots.task_executor.is_kubernetes_mode', return_value=True)
+    @patch('bots.task_executor.task_executor')
+    @patch('bots.domain_wide.tasks.handle_google_webhook')
+    def test_kubernetes_mode_uses_task_executor(self, mock_task, mock_executor, mock_k8s_mode):
+        from bots.domain_wide.tasks import enqueue_google_webhook_task, handle_google_webhook_sync
+        enqueue_google_webhook_task('channel-1')
+        mock_executor.submit.assert_called_once_with(handle_google_webhook_sync, 'channel-1')
+        mock_task.delay.assert_not_called()
+
+
+class TestPodLogStreamReconnect(SimpleTestCase):
+    """Test that a reconnected single-pod log stream doesn't repeat lines."""
+
+    def test_log_stamp_key_pads_trimmed_fractions(self):
+        from bots.domain_wide.views.logs import _log_stamp_key
+        self.assertLess(
+            _log_stamp_key('2026-01-01T12:00:00.1Z first'),
+            _log_stamp_key('2026-01-01T12:00:00.12Z second'),
+        )
+        self.assertLess(
+            _log_stamp_key('2026-01-01T12:00:00Z first'),
+            _log_stamp_key('2026-01-01T12:00:00.000000001Z second'),
+        )
+        self.assertIsNone(_log_stamp_key('no stamp here'))
+
+    @patch('bots.domain_wide.views.logs.time.sleep')
+    @patch('bots.domain_wide.views.logs._init_kubernetes_client')
+    @patch('bots.domain_wide.views.logs.LogStreamView._detect_mode', return_value='kubernetes')
+    def test_reconnect_skips_replayed_lines(self, mock_mode, mock_init_client, mock_sleep):
+        import json
+
+        import urllib3
+
+        from bots.domain_wide.views.logs import LogStreamView
+
+        pod = MagicMock()
+        pod.metadata.name = 'bot-abc'
+        pod.status.phase = 'Running'
+        pod.spec.containers = [MagicMock()]
+        mock_init_client.return_value.list_namespaced_pod.return_value.items = [pod]
+
+        first = ['2026-01-01T12:00:00.1Z INFO one', '2026-01-01T12:00:00.5Z INFO two']
+        # since_seconds rounds up, so the reopened stream replays "one" and "two"
+        second = first + ['2026-01-01T12:00:01.2Z INFO three']
+
+        def first_stream(*args, **kwargs):
+            yield from first
+            raise urllib3.exceptions.ProtocolError('Connection reset')
+
+        streams = iter([first_stream(), iter(second)])
+
+        with patch('kubernetes.watch.Watch') as mock_watch:
+            mock_watch.return_value.stream.side_effect = lambda *args, **kwargs: next(streams)
+            request = RequestFactory().get('/dashboard/api/logs/stream', {'source': 'bot-abc', 'level': 'INFO'})
+            response = LogStreamView().get(request)
+            chunks = [chunk.decode() if isinstance(chunk, bytes) else chunk for chunk in response.streaming_content]
+            events = [json.loads(chunk[len('data: '):]) for chunk in chunks if chunk.startswith('data: ')]
+
+        self.assertEqual([e['message'] for e in events], ['INFO one', 'INFO two', 'INFO three'])
+
+
+def _unsigned_jwt(claims):
+    """Build an unsigned JWT carrying the given claims."""
+    import base64
+    import json
+
+    def segment(data):
+        return base64.urlsafe_b64encode(json.dumps(data).encode()).decode().rstrip('=')
+
+    return f"{segment({'alg': 'RS256', 'typ': 'JWT'})}.{segment(claims)}.c2ln"
+
+
+class TestGoogleIdTokenEmail(SimpleTestCase):
+    """Test email extraction from the id_token in Google's token response."""
+
+    CLIENT_ID = 'client-123.apps.googleusercontent.com'
+
+    def _claims(self, **overrides):
+        claims = {
+            'aud': self.CLIENT_ID,
+            'iss': 'https://accounts.google.com',
+            'email': 'User@Example.com',
+            'email_verified': True,
+        }
+        claims.update(overrides)
+        return claims
+
+    def test_valid_token_returns_lowercased_email(self):
+        from bots.domain_wide.views.oauth import _email_from_google_id_token
+        token = _unsigned_jwt(self._claims())
+        self.assertEqual(_email_from_google_id_token(token, self.CLIENT_ID), 'user@example.com')
+
+    def test_bare_issuer_is_accepted(self):
+        from bots.domain_wide.views.oauth import _email_from_google_id_token
+        token = _unsigned_jwt(self._claims(iss='accounts.google.com'))
+        self.assertEqual(_email_from_google_id_token(token, self.CLIENT_ID), 'user@example.com')
+
+    def test_wrong_audience_returns_empty(self):
+        from bots.domain_wide.views.oauth import _email_from_google_id_token
+        token = _unsigned_jwt(self._claims(aud='someone-else.apps.googleusercontent.com'))
+        self.assertEqual(_email_from_google_id_token(token, self.CLIENT_ID), '')
+
+    def test_wrong_issuer_returns_empty(self):
+        from bots.domain_wide.views.oauth import _email_from_google_id_token
+        token = _unsigned_jwt(self._claims(iss='https://evil.example.com'))
+        self.assertEqual(_email_from_google_id_token(token, self.CLIENT_ID), '')
+
+    def test_unverified_email_returns_empty(self):
+        from bots.domain_wide.views.oauth import _email_from_google_id_token
+        token = _unsigned_jwt(self._claims(email_verified=False))
+        self.assertEqual(_email_from_google_id_token(token, self.CLIENT_ID), '')
+
+    def test_missing_or_malformed_token_returns_empty(self):
+        from bots.domain_wide.views.oauth import _email_from_google_id_token
+        for token in (None, '', 'not-a-jwt', 'a.b.c', 'e30.W10.c2ln'):
+            with self.subTest(token=token):
+                self.assertEqual(_email_from_google_id_token(token, self.CLIENT_ID), '')
+
+    @patch('bots.domain_wide.views.oauth.enqueue_link_oauth_calendar_task')
+    @patch('bots.domain_wide.views.oauth.render')
+    @patch('bots.domain_wide.utils.encrypt_token', side_effect=lambda token: f'enc:{token}')
+    @patch('bots.domain_wide.models.OAuthCredential')
+    @patch('bots.domain_wide.views.oauth._oauth_session')
+    @patch('bots.domain_wide.views.oauth._google_oauth_config')
+    def test_callback_falls_back_to_userinfo(
+        self, mock_config, mock_session, mock_credential, mock_encrypt, mock_render, mock_enqueue
+    ):
+        """Callback should ask the userinfo endpoint when the id_token yields no email."""
+        from bots.domain_wide.views.oauth import GoogleOAuthCallback
+
+        mock_config.return_value = (self.CLIENT_ID, 'secret', 'https://example.com/callback')
+        mock_session.post.return_value.json.return_value = {
+            'access_token': 'access',
+            'refresh_token': 'refresh',
+            'expires_in': 3600,
+            'id_token': _unsigned_jwt(self._claims(email_verified=False)),
+        }
+        mock_session.get.return_value.json.return_value = {'email': 'Fallback@Example.com'}
+        mock_credential.objects.update_or_create.return_value = (MagicMock(id=42), True)
+
+        request = RequestFactory().get('/oauth/google/callback/', {'code': 'auth-code'})
+        GoogleOAuthCallback().get(request)
+
+        mock_session.get.assert_called_once()
+        self.assertEqual(mock_session.get.call_args[0][0], 'https://www.googleapis.com/oauth2/v2/userinfo')
+        self.assertEqual(mock_credential.objects.update_or_create.call_args[1]['email'], 'fallback@example.com')
+        mock_enqueue.assert_called_once_with(42)
+        self.assertEqual(mock_render.call_args[0][1], 'domain_wide/oauth_success.html')
+
+    @patch('bots.domain_wide.views.oauth.enqueue_link_oauth_calendar_task')
+    @patch('bots.domain_wide.views.oauth.render')
+    @patch('bots.domain_wide.utils.encrypt_token', side_effect=lambda token: f'enc:{token}')
+    @patch('bots.domain_wide.models.OAuthCredential')
+    @patch('bots.domain_wide.views.oauth._oauth_session')
+    @patch('bots.domain_wide.views.oauth._google_oauth_config')
+    def test_callback_skips_userinfo_with_verified_id_token(
+        self, mock_config, mock_session, mock_credential, mock_encrypt, mock_render, mock_enqueue
+    ):
+        """Callback should take the email from a valid id_token without a userinfo call."""
+        from bots.domain_wide.views.oauth import GoogleOAuthCallback
+
+        mock_config.return_value = (self.CLIENT_ID, 'secret', 'https://example.com/callback')
+        mock_session.post.return_value.json.return_value = {
+            'access_token': 'access',
+            'expires_in': 3600,
+            'id_token': _unsigned_jwt(self._claims()),
+        }
+        mock_credential.objects.update_or_create.return_value = (MagicMock(id=42), True)
+
+        request = RequestFactory().get('/oauth/google/callback/', {'code': 'auth-code'})
+        GoogleOAuthCallback().get(request)
+
+        mock_session.get.assert_not_called()
+        self.assertEqual(mock_credential.objects.update_or_create.call_args[1]['email'], 'user@example.com')
+
+
+class TestBotResourcesAPIPaging(TestCase):
+    """Test the since/limit cursor on BotResourcesAPI against real snapshot rows."""
+
+    def setUp(self):
+        from accounts.models import Organization
+        from bots.models import Bot, BotResourceSnapshot, BotStates, Project
+
+        organization = Organization.objects.create(name="Test Organization")
+        project = Project.objects.create(name="Test Project", organization=organization)
+        self.bot = Bot.objects.create(
+            project=project,
+            name="Test Bot",
+            meeting_url="https://meet.google.com/abc-defg-hij",
+            state=BotStates.ENDED,
+        )
+
+        # Twelve snapshots 30s apart; memory 100..111, cpu 200..211
+        self.start = datetime(2026, 1, 1, 12, 0, tzinfo=dt_timezone.utc)
+        for i in range(12):
+            snapshot = BotResourceSnapshot.objects.create(
+                bot=self.bot,
+                data={'ram_usage_megabytes': 100 + i, 'cpu_usage_millicores': 200 + i},
+            )
+            # created_at is auto_now_add, so set the series times afterwards
+            BotResourceSnapshot.objects.filter(id=snapshot.id).update(created_at=self.start + timedelta(seconds=30 * i))
+
+    def _get(self, **params):
+        import json
+
+        from bots.domain_wide.views.resources import BotResourcesAPI
+        request = RequestFactory().get('/dashboard/api/bot-resources/', {'bot_id': str(self.bot.id), **params})
+        response = BotResourcesAPI().get(request)
+        return response.status_code, json.loads(response.content)
+
+    def test_unpaginated_returns_full_series(self):
+        status, data = self._get()
+        self.assertEqual(status, 200)
+        self.assertEqual([point['memory_mb'] for point in data['time_series']], list(range(100, 112)))
+        self.assertIsNone(data['next_cursor'])
+        self.assertEqual(data['peak']['memory_mb'], 111)
+        self.assertEqual(data['peak']['cpu_millicores'], 211)
+
+    def test_default_page_size(self):
+        from bots.domain_wide.views.resources import BotResourcesAPI
+        with patch.object(BotResourcesAPI, 'DEFAULT_PAGE_SIZE', 5):
+            status, data = self._get(since='2026-01-01T00:00:00Z')
+        self.assertEqual(status, 200)
+        self.assertEqual([point['memory_mb'] for point in data['time_series']], list(range(100, 105)))
+        # Peaks cover the whole series, not just the page
+        self.assertEqual(data['peak']['memory_mb'], 111)
+
+    def test_limit_is_capped_at_max_page_size(self):
+        from bots.domain_wide.views.resources import BotResourcesAPI
+        with patch.object(BotResourcesAPI, 'MAX_PAGE_SIZE', 4):
+            status, data = self._get(limit='1000')
+        self.assertEqual(status, 200)
+        self.assertEqual(len(data['time_series']), 4)
+        self.assertIsNotNone(data['next_cursor'])
+
+    def test_next_cursor_round_trips_through_all_pages(self):
+        seen = []
+        params = {'limit': '5'}
+        for _ in range(5):
+            status, data = self._get(**params)
+            self.assertEqual(status, 200)
+            seen.extend(point['memory_mb'] for point in data['time_series'])
+            if data['next_cursor'] is None:
+                break
+            self.assertNotIn('+', data['next_cursor'])
+            params = {'limit': '5', 'since': data['next_cursor']}
+        self.assertEqual(seen, list(range(100, 112)))
+        self.assertIsNone(data['next_cursor'])
+
+    def test_next_cursor_is_null_on_exactly_full_last_page(self):
+        status, data = self._get(since='2026-01-01T12:03:00Z', limit='5')
+        self.assertEqual(status, 200)
+        self.assertEqual([point['memory_mb'] for point in data['time_series']], list(range(107, 112)))
+        self.assertIsNone(data['next_cursor'])
+
+    def test_since_with_unencoded_offset_is_accepted(self):
+        # '+00:00' sent unencoded arrives as ' 00:00'
+        status, data = self._get(since='2026-01-01T12:03:00 00:00', limit='5')
+        self.assertEqual(status, 200)
+        self.assertEqual(data['time_series'][0]['memory_mb'], 107)
+
+    def test_space_separated_and_naive_since_are_taken_as_utc(self):
+        status, data = self._get(since='2026-01-01 12:03:00', limit='5')
+        self.assertEqual(status, 200)
+        self.assertEqual(data['time_series'][0]['memory_mb'], 107)
+
+    def test_invalid_since_returns_400(self):
+        for since in ('yesterday', '2026-13-01T00:00:00'):
+            with self.subTest(since=since):
+                status, data = self._get(since=since)
+                self.assertEqual(status, 400)
+                self.assertIn('since', data['error'])
+
+    def test_invalid_limit_returns_400(self):
+        status, data = self._get(limit='many')
+        self.assertEqual(status, 400)
+        self.assertIn('limit', data['error'])
@@ -0,0 +1,129 @@
+"""
+In-memory List+Watch cache for Kubernetes resources polled by the dashboard.
+
+Each resource kind is listed once and then kept current by a background
+watch thread, so dashboard polls read a snapshot from memory instead of
+issuing a full LIST against the apiserver.
+"""
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Each watch request is closed by the apiserver after this many seconds and
+# immediately re-opened, which doubles as a liveness heartbeat.
+_WATCH_TIMEOUT_SECONDS = 30
+
+# Snapshots older than this are treated as stale and callers fall back to a
+# live LIST.
+_STALE_AFTER_SECONDS = 60
+
+# Back-off between attempts after a watch or list failure.
+_RETRY_DELAY_SECONDS = 5
+
+
+class ResourceCache:
+    """
+    Keeps pods, nodes and deployments in memory via List+Watch.
+
+    Watches are started lazily on first read. Reads return a list of the
+    client model objects, or None if the watch hasn't synced yet or has gone
+    quiet for longer than _STALE_AFTER_SECONDS; callers then do a live LIST.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stores = {}
+        self._synced_at = {}
+        self._watchers = set()
+
+    def list_pods(self, v1, namespace, label_selector=''):
+        return self._snapshot(
+            ('pods', namespace, label_selector),
+            v1.list_namespaced_pod,
+            namespace=namespace,
+            label_selector=label_selector,
+        )
+
+    def list_nodes(self, v1):
+        return self._snapshot(('nodes',), v1.list_node)
+
+    def list_deployments(self, apps_v1, namespace):
+        return self._snapshot(('deployments', namespace), apps_v1.list_namespaced_deployment, namespace=namespace)
+
+    def _snapshot(self, key, list_func, **kwargs):
+        self._ensure_watch(key, list_func, kwargs)
+        with self._lock:
+            synced_at = self._synced_at.get(key)
+            if synced_at is None or time.time() - synced_at > _STALE_AFTER_SECONDS:
+                return None
+            return list(self._stores[key].values())
+
+    def _ensure_watch(self, key, list_func, kwargs):
+        with self._lock:
+            if key in self._watchers:
+                return
+            self._watchers.add(key)
+
+        thread = threading.Thread(
+            target=self._run_watch,
+            args=(key, list_func, kwargs),
+            name=f"k8s_cache_{key[0]}",
+            daemon=True,
+        )
+        thread.start()
+
+    def _run_watch(self, key, list_func, kwargs):
+        from kubernetes import client, watch
+
+        while True:
+            try:
+                # Seed from the apiserver watch cache, as client-go informers do
+                initial = list_func(resource_version='0', **kwargs)
+                with self._lock:
+                    self._stores[key] = {obj.metadata.name: obj for obj in initial.items}
+                    self._synced_at[key] = time.time()
+                resource_version = initial.metadata.resource_version
+
+                while True:
+                    w = watch.Watch()
+                    for event in w.stream(
+                        list_func,
+                        resource_version=resource_version,
+                        allow_watch_bookmarks=True,
+                        timeout_seconds=_WATCH_TIMEOUT_SECONDS,
+                        **kwargs,
+                    ):
+                        event_type = event['type']
+                        if event_type == 'BOOKMARK':
+                            resource_version = event['raw_object']['metadata']['resourceVersion']
+                        else:
+                            obj = event['object']
+                            resource_version = obj.metadata.resource_version
+                        with self._lock:
+                            if event_type == 'DELETED':
+                                self._stores[key].pop(obj.metadata.name, None)
+                            elif event_type in ('ADDED', 'MODIFIED'):
+                                self._stores[key][obj.metadata.name] = obj
+                            self._synced_at[key] = time.time()
+
+                    # Window closed cleanly; the snapshot is current as of now
+                    with self._lock:
+                        self._synced_at[key] = time.time()
+
+            except client.ApiException as e:
+                if e.status == 410:
+                    # resourceVersion expired; relist straight away
+                    logger.info(f"Watch for {key} expired, relisting")
+                    continue
+                logger.warning(f"Watch for {key} failed: {e}")
+            except Exception as e:
+                logger.warning(f"Watch for {key} failed: {e}")
+
+            with self._lock:
+                self._synced_at.pop(key, None)
+            time.sleep(_RETRY_DELAY_SECONDS)
+
+
+resource_cache = ResourceCache()
@@ -1,41 +1,180 @@
 """
 Kubernetes monitoring and infrastructure status APIs.
 """
+import heapq
+import json
 import logging
 import os
+import re
+import threading
 import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone as dt_timezone
+from functools import lru_cache
 
 from django.conf import settings
+from django.core.cache import cache
 from django.http import JsonResponse
 from django.utils import timezone
+from django.utils.dateparse import parse_datetime
 from django.views import View
 
 from bots.models import Bot, BotStates, BotEvent, BotEventTypes
 
+from .k8s_cache import resource_cache
+
 logger = logging.getLogger(__name__)
 
+# Enum label lookups, built once at import rather than per request
+_STATE_NAMES = {s.value: s.label for s in BotStates}
+_EVENT_TYPE_NAMES = {e.value: e.label for e in BotEventTypes}
+
+# Shared pool for fanning out blocking Kubernetes API calls. The client
+# releases the GIL while waiting on HTTP, so per-namespace lists overlap.
+_K8S_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix='k8s_api')
+
+# resourceVersion=0 lets the apiserver answer LIST calls from its watch cache
+# instead of a quorum read through etcd. The dashboard tolerates a few seconds
+# of staleness, so use it for every status list call.
+_FROM_CACHE = '0'
+
+# Docker containers shown on the infrastructure panel
+_RELEVANT_CONTAINER_RE = re.compile(r'attendee|worker|scheduler|redis|postgres', re.IGNORECASE)
+
+
+_K8S_API_CLIENT = None
+_K8S_API_CLIENT_LOCK = threading.Lock()
+
+
+def _get_k8s_api_client():
+    """
+    Return the process-wide Kubernetes ApiClient, loading config on first use.
+
+    Reusing one client keeps its urllib3 pool (and TLS sessions) alive across
+    requests instead of redoing config loading and handshakes per call.
+    """
+    global _K8S_API_CLIENT
+    if _K8S_API_CLIENT is not None:
+        return _K8S_API_CLIENT
+
+    with _K8S_API_CLIENT_LOCK:
+        if _K8S_API_CLIENT is None:
+            from kubernetes import client, config
+
+            # Load config
+            try:
+                config.load_incluster_config()
+            except config.ConfigException:
+                config.load_kube_config()
+
+            configuration = client.Configuration.get_default_copy()
+            # Room for the fan-out on _K8S_POOL plus concurrent dashboard requests
+            configuration.connection_pool_maxsize = 20
+
+            # Allow skipping TLS verification for dev environments
+            if os.getenv('KUBERNETES_SKIP_TLS_VERIFY', '').lower() == 'true':
+                import urllib3
+                urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+                configuration.verify_ssl = False
+
+            # Callers that still build APIs with the default configuration
+            # (e.g. client.CustomObjectsApi()) keep working.
+            client.Configuration.set_default(configuration)
+            _K8S_API_CLIENT = client.ApiClient(configuration)
+
+    return _K8S_API_CLIENT
+
 
 def _init_kubernetes_client():
-    """Initialize Kubernetes client with proper configuration."""
-    from kubernetes import client, config
+    """Return a CoreV1Api bound to the shared Kubernetes ApiClient."""
+    from kubernetes import client
 
-    # Load config
-    try:
-        config.load_incluster_config()
-    except config.ConfigException:
-        config.load_kube_config()
+    return client.CoreV1Api(api_client=_get_k8s_api_client())
 
-    # Allow skipping TLS verification for dev environments
-    if os.getenv('KUBERNETES_SKIP_TLS_VERIFY', '').lower() == 'true':
-        import urllib3
-        urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-        configuration = client.Configuration.get_default_copy()
-        configuration.verify_ssl = False
-        client.Configuration.set_default(configuration)
 
-    return client.CoreV1Api()
+def _apps_v1():
+    """Return an AppsV1Api bound to the shared Kubernetes ApiClient."""
+    from kubernetes import client
+
+    return client.AppsV1Api(api_client=_get_k8s_api_client())
+
+
+def _custom_api():
+    """Return a CustomObjectsApi bound to the shared Kubernetes ApiClient."""
+    from kubernetes import client
+
+    return client.CustomObjectsApi(api_client=_get_k8s_api_client())
+
 
+@lru_cache(maxsize=1)
+def _detect_infrastructure_mode():
+    """
+    Detect if running in Kubernetes or Docker mode.
 
+    Neither the environment nor the service account mount changes within a
+    process, so this is worked out once rather than per request.
+    """
+    # Allow explicit override via environment variable (useful for testing)
+    force_mode = os.getenv('INFRASTRUCTURE_MODE')
+    if force_mode in ('kubernetes', 'docker'):
+        return force_mode
+    # Check for Kubernetes service account (present when running in K8s)
+    if os.path.exists('/var/run/secrets/kubernetes.io/serviceaccount/token'):
+        return 'kubernetes'
+    # Check for KUBERNETES_SERVICE_HOST env var
+    if os.getenv('KUBERNETES_SERVICE_HOST'):
+        return 'kubernetes'
+    return 'docker'
+
+
+_BROKER_REDIS = None
+
+
+def _get_broker_redis():
+    """Return a Redis client for the Celery broker, shared across requests."""
+    global _BROKER_REDIS
+    if _BROKER_REDIS is None:
+        import redis
+        _BROKER_REDIS = redis.from_url(settings.CELERY_BROKER_URL, socket_connect_timeout=0.5)
+    return _BROKER_REDIS
+
+
+_CELERY_INSPECT_CACHE_KEY = 'domain_wide:celery_inspect'
+_CELERY_INSPECT_CACHE_TTL_SECONDS = 10
+_CELERY_INSPECT_TIMEOUT_SECONDS = 0.25
+
+
+def _list_pod_items(v1, namespace):
+    """
+    List pods in a namespace as raw API dicts.
+
+    Skips the client's V1Pod model deserialization (dozens of nested objects
+    per pod) since the status views only read a handful of leaf fields.
+    Keys are therefore the API's camelCase names (e.g. status.containerStatuses).
+    """
+    response = v1.list_namespaced_pod(
+        namespace=namespace,
+        resource_version=_FROM_CACHE,
+        _preload_content=False,
+    )
+    return json.loads(response.data).get('items', [])
+
+
+def _submit_pod_lists(v1, namespaces):
+    """Start listing pods (as raw dicts) in each namespace concurrently. Returns {namespace: future}."""
+    return {ns: _K8S_POOL.submit(_list_pod_items, v1, ns) for ns in namespaces}
+
+
+def _container_requests(pod):
+    """Yield the resource requests dict of each container in a raw pod dict."""
+    for container in pod.get('spec', {}).get('containers') or []:
+        yield (container.get('resources') or {}).get('requests') or {}
+
+
+# Quantity strings repeat heavily across pods and polls ("100m", "256Mi"), so
+# each distinct string is parsed once.
+@lru_cache(maxsize=2048)
 def _parse_cpu(cpu_str):
     """Parse CPU string to millicores."""
     if not cpu_str:
@@ -52,43 +191,225 @@ def _parse_cpu(cpu_str):
             return 0
 
 
+# Memory unit letter -> (binary multiplier for the 'Xi' form, decimal multiplier for the 'X' form)
+_MEMORY_MULTIPLIERS = {
+    'K': (1024, 1000),
+    'M': (1024**2, 1000**2),
+    'G': (1024**3, 1000**3),
+    'T': (1024**4, 1000**4),
+}
+
+
+@lru_cache(maxsize=2048)
 def _parse_memory(mem_str):
     """Parse memory string to bytes."""
     if not mem_str:
         return 0
     mem_str = str(mem_str)
-    multipliers = {
-        'Ki': 1024, 'Mi': 1024**2, 'Gi': 1024**3, 'Ti': 1024**4,
-        'K': 1000, 'M': 1000**2, 'G': 1000**3, 'T': 1000**4,
-    }
-    for suffix, mult in multipliers.items():
-        if mem_str.endswith(suffix):
-            try:
-                return int(float(mem_str[:-len(suffix)]) * mult)
-            except ValueError:
-                return 0
+    # Suffixes are distinguishable by the trailing 'i' plus a single unit letter,
+    # so index straight into the table instead of scanning every suffix.
+    if mem_str[-1] == 'i':
+        mults = _MEMORY_MULTIPLIERS.get(mem_str[-2:-1])
+        if mults is None:
+            return 0
+        number, mult = mem_str[:-2], mults[0]
+    else:
+        mults = _MEMORY_MULTIPLIERS.get(mem_str[-1])
+        if mults is None:
+            number, mult = mem_str, 1
+        else:
+            number, mult = mem_str[:-1], mults[1]
     try:
-        return int(mem_str)
+        return int(float(number) * mult) if mult != 1 else int(number)
     except ValueError:
         return 0
 
 
+_POD_SCAN_CACHE_TTL_SECONDS = 5
+
+# Container waiting/terminated reasons that feed summary['by_issue']
+_TRACKED_ISSUES = frozenset({'CrashLoopBackOff', 'ImagePullBackOff', 'ErrImagePull', 'OOMKilled'})
+
+
+def _scan_pods(v1, namespaces):
+    """
+    Walk every pod in the given namespaces once for the pods and alerts panels.
+
+    Returns a dict with:
+        pods: per-pod rows for KubernetesPodsAPI
+        summary: phase/issue counts for KubernetesPodsAPI
+        alerts: pod-level alerts for KubernetesAlertsAPI
+        cpu_requested / memory_requested: requests of Running/Pending pods
+
+    The dashboard loads both panels together, so the result is cached for a
+    few seconds and the second request doesn't trigger another LIST.
+    """
+    from kubernetes import client
+
+    cache_key = 'domain_wide:k8s_pod_scan:' + ','.join(namespaces)
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    pods_list = []
+    alerts = []
+    summary = {
+        'total': 0,
+        'by_phase': {},
+        'by_issue': {},
+    }
+    phase_counts = Counter()
+    issues = []
+    cpu_requested = 0
+    memory_requested = 0
+    # One clock read for the whole scan; ages are plain float subtraction
+    now_ts = time.time()
+
+    for ns, pods_future in _submit_pod_lists(v1, namespaces).items():
+        try:
+            pods = pods_future.result()
+        except client.ApiException as e:
+            logger.warning(f"Failed to list pods in namespace {ns}: {e}")
+            continue
+
+        for pod in pods:
+            metadata = pod['metadata']
+            pod_status = pod['status']
+            pod_name = metadata['name']
+            summary['total'] += 1
+            phase = pod_status.get('phase') or 'Unknown'
+            phase_counts[phase] += 1
+
+            # Calculate age
+            age_seconds = None
+            created = parse_datetime(metadata.get('creationTimestamp') or '')
+            if created:
+                age_seconds = int(now_ts - created.timestamp())
+
+            # Extract bot_id from pod name
+            bot_id = None
+            if pod_name.startswith('bot-'):
+                parts = pod_name.split('-')
+                if len(parts) >= 2:
+                    for part in parts:
+                        if part.startswith('bot_'):
+                            bot_id = part
+                            break
+
+            # Track resource requests
+            if phase in ['Running', 'Pending']:
+                for requests in _container_requests(pod):
+                    cpu_requested += _parse_cpu(requests.get('cpu', '0'))
+                    memory_requested += _parse_memory(requests.get('memory', '0'))
+
+            # Check for evicted/failed pods
+            if phase == 'Failed':
+                reason = pod_status.get('reason') or 'Unknown'
+                alerts.append({
+                    'severity': 'warning',
+                    'type': 'pod_failed',
+                    'message': f'Pod {pod_name} failed: {reason}',
+                    'resource': pod_name,
+                })
+
+            # Container statuses
+            container_statuses = []
+            for cs in (pod_status.get('containerStatuses') or []):
+                container_name = cs.get('name')
+                restart_count = cs.get('restartCount', 0)
+                state = 'unknown'
+                reason = None
+
+                if restart_count > 3:
+                    alerts.append({
+                        'severity': 'critical',
+                        'type': 'pod_crash_loop',
+                        'message': f'Pod {pod_name} container {container_name} restarted {restart_count} times',
+                        'resource': pod_name,
+                    })
+
+                cs_state = cs.get('state') or {}
+                if 'running' in cs_state:
+                    state = 'running'
+                elif 'waiting' in cs_state:
+                    state = 'waiting'
+                    reason = cs_state['waiting'].get('reason')
+                    if reason in _TRACKED_ISSUES:
+                        issues.append(reason)
+                    if reason in ('ImagePullBackOff', 'ErrImagePull'):
+                        alerts.append({
+                            'severity': 'critical',
+                            'type': 'pod_image_pull_error',
+                            'message': f'Pod {pod_name} has {reason}',
+                            'resource': pod_name,
+                        })
+                elif 'terminated' in cs_state:
+                    state = 'terminated'
+                    reason = cs_state['terminated'].get('reason')
+                    if reason in _TRACKED_ISSUES:
+                        issues.append(reason)
+                    if reason == 'OOMKilled':
+                        alerts.append({
+                            'severity': 'warning',
+                            'type': 'pod_oom_killed',
+                            'message': f'Pod {pod_name} container {container_name} was OOMKilled',
+                            'resource': pod_name,
+                        })
+
+                container_statuses.append({
+                    'name': container_name,
+                    'ready': cs.get('ready'),
+                    'restart_count': restart_count,
+                    'state': state,
+                    'reason': reason,
+                })
+
+            # Pod pending too long (>5 min)
+            if phase == 'Pending' and age_seconds and age_seconds > 300:
+                issues.append('Pending')
+                alerts.append({
+                    'severity': 'warning',
+                    'type': 'pod_pending_long',
+                    'message': f'Pod {pod_name} pending for {age_seconds // 60} minutes',
+                    'resource': pod_name,
+                })
+
+            pods_list.append({
+                'name': pod_name,
+                'namespace': ns,
+                'phase': phase,
+                'bot_id': bot_id,
+                'node': pod.get('spec', {}).get('nodeName'),
+                'age_seconds': age_seconds,
+                'container_statuses': container_statuses,
+            })
+
+    summary['by_phase'] = dict(phase_counts)
+    issue_counts = Counter(issues)
+    summary['by_issue'] = {
+        'CrashLoopBackOff': issue_counts['CrashLoopBackOff'],
+        'ImagePullBackOff': issue_counts['ImagePullBackOff'] + issue_counts['ErrImagePull'],
+        'OOMKilled': issue_counts['OOMKilled'],
+        'Pending': issue_counts['Pending'],
+    }
+
+    result = {
+        'pods': pods_list,
+        'summary': summary,
+        'alerts': alerts,
+        'cpu_requested': cpu_requested,
+        'memory_requested': memory_requested,
+    }
+    cache.set(cache_key, result, _POD_SCAN_CACHE_TTL_SECONDS)
+    return result
+
+
 class InfrastructureStatusAPI(View):
     """API for infrastructure status (containers/kubernetes + Celery)."""
 
     def _detect_mode(self):
         """Detect if running in Kubernetes or Docker mode."""
-        # Allow explicit override via environment variable (useful for testing)
-        force_mode = os.getenv('INFRASTRUCTURE_MODE')
-        if force_mode in ('kubernetes', 'docker'):
-            return force_mode
-        # Check for Kubernetes service account (present when running in K8s)
-        if os.path.exists('/var/run/secrets/kubernetes.io/serviceaccount/token'):
-            return 'kubernetes'
-        # Check for KUBERNETES_SERVICE_HOST env var
-        if os.getenv('KUBERNETES_SERVICE_HOST'):
-            return 'kubernetes'
-        return 'docker'
+        return _detect_infrastructure_mode()
 
     def _get_kubernetes_status(self):
         """Get Kubernetes cluster status."""
@@ -108,29 +429,31 @@ class InfrastructureStatusAPI(View):
                 getattr(settings, 'WEBPAGE_STREAMER_POD_NAMESPACE', 'attendee-webpage-streamer'),
             ]
 
+            pod_futures = _submit_pod_lists(v1, namespaces_to_check)
+            nodes_future = _K8S_POOL.submit(v1.list_node, resource_version=_FROM_CACHE)
+
             namespace_data = []
-            for ns in namespaces_to_check:
+            pods_by_ns = {}
+            for ns, pods_future in pod_futures.items():
                 try:
-                    pods = v1.list_namespaced_pod(namespace=ns)
-                    pod_counts = {'total': 0, 'running': 0, 'pending': 0, 'failed': 0, 'succeeded': 0}
-                    for pod in pods.items:
-                        pod_counts['total'] += 1
-                        phase = (pod.status.phase or '').lower()
-                        if phase == 'running':
-                            pod_counts['running'] += 1
-                        elif phase == 'pending':
-                            pod_counts['pending'] += 1
-                        elif phase == 'failed':
-                            pod_counts['failed'] += 1
-                        elif phase == 'succeeded':
-                            pod_counts['succeeded'] += 1
+                    pods = pods_future.result()
+                    pods_by_ns[ns] = pods
+                    # The apiserver phase strings are already canonical, so count them as-is
+                    phase_counts = Counter(pod['status'].get('phase') for pod in pods)
+                    pod_counts = {
+                        'total': len(pods),
+                        'running': phase_counts['Running'],
+                        'pending': phase_counts['Pending'],
+                        'failed': phase_counts['Failed'],
+                        'succeeded': phase_counts['Succeeded'],
+                    }
                     namespace_data.append({'name': ns, 'pods': pod_counts})
                 except client.ApiException as e:
                     logger.warning(f"Failed to get pods for namespace {ns}: {e}")
                     namespace_data.append({'name': ns, 'pods': None, 'error': str(e)})
 
             # Get node status
-            nodes = v1.list_node()
+            nodes = nodes_future.result()
             node_counts = {'total': 0, 'ready': 0, 'not_ready': 0}
             cpu_allocatable = 0
             memory_allocatable = 0
@@ -157,18 +480,13 @@ class InfrastructureStatusAPI(View):
             # Get resource requests from pods
             cpu_requested = 0
             memory_requested = 0
-            for ns in namespaces_to_check:
-                try:
-                    pods = v1.list_namespaced_pod(namespace=ns)
-                    for pod in pods.items:
-                        if pod.status.phase not in ['Running', 'Pending']:
-                            continue
-                        for container in (pod.spec.containers or []):
-                            requests = (container.resources.requests or {}) if container.resources else {}
-                            cpu_requested += _parse_cpu(requests.get('cpu', '0'))
-                            memory_requested += _parse_memory(requests.get('memory', '0'))
-                except Exception:
-                    pass
+            for pods in pods_by_ns.values():
+                for pod in pods:
+                    if pod['status'].get('phase') not in ['Running', 'Pending']:
+                        continue
+                    for requests in _container_requests(pod):
+                        cpu_requested += _parse_cpu(requests.get('cpu', '0'))
+                        memory_requested += _parse_memory(requests.get('memory', '0'))
 
             return {
                 'api_healthy': True,
@@ -204,7 +522,7 @@ class InfrastructureStatusAPI(View):
             for container in client.containers.list(all=True):
                 name = container.name
                 # Filter to relevant containers
-                if any(x in name.lower() for x in ['attendee', 'worker', 'scheduler', 'redis', 'postgres']):
+                if _RELEVANT_CONTAINER_RE.search(name):
                     status = container.status
                     running = status == 'running'
 
@@ -264,25 +582,21 @@ class InfrastructureStatusAPI(View):
         try:
             from attendee.celery import app as celery_app
 
-            # Inspect workers
-            inspect = celery_app.control.inspect()
-
-            # Active workers
-            active_workers = inspect.active()
-            if active_workers:
-                celery_status['workers'] = len(active_workers)
-                celery_status['active_tasks'] = sum(len(tasks) for tasks in active_workers.values())
-
-            # Reserved (pending) tasks
-            reserved = inspect.reserved()
-            if reserved:
-                celery_status['pending_tasks'] = sum(len(tasks) for tasks in reserved.values())
+            # The inspect broadcast waits for every worker to reply, so bound the
+            # wait and reuse the answer across dashboard refreshes.
+            worker_counts = cache.get(_CELERY_INSPECT_CACHE_KEY)
+            if worker_counts is None:
+                active_workers = celery_app.control.inspect(timeout=_CELERY_INSPECT_TIMEOUT_SECONDS).active() or {}
+                worker_counts = {
+                    'workers': len(active_workers),
+                    'active_tasks': sum(len(tasks) for tasks in active_workers.values()),
+                }
+                cache.set(_CELERY_INSPECT_CACHE_KEY, worker_counts, _CELERY_INSPECT_CACHE_TTL_SECONDS)
+            celery_status.update(worker_counts)
 
-            # Try to get queue length from Redis
+            # Pending tasks = length of the default queue on the broker
             try:
-                import redis
-                r = redis.from_url('redis://localhost:6379/0')
-                celery_status['pending_tasks'] = r.llen('celery')
+                celery_status['pending_tasks'] = _get_broker_redis().llen('celery')
             except Exception:
                 pass
 
@@ -312,8 +626,6 @@ class KubernetesPodsAPI(View):
     """API for listing all bot pods with detailed status."""
 
     def get(self, request):
-        from kubernetes import client
-
         try:
             v1 = _init_kubernetes_client()
 
@@ -322,87 +634,11 @@ class KubernetesPodsAPI(View):
                 getattr(settings, 'WEBPAGE_STREAMER_POD_NAMESPACE', 'attendee-webpage-streamer'),
             ]
 
-            pods_list = []
-            summary = {
-                'total': 0,
-                'by_phase': {},
-                'by_issue': {'CrashLoopBackOff': 0, 'ImagePullBackOff': 0, 'OOMKilled': 0, 'Pending': 0}
-            }
-
-            for ns in namespaces:
-                try:
-                    pods = v1.list_namespaced_pod(namespace=ns)
-                    for pod in pods.items:
-                        summary['total'] += 1
-                        phase = pod.status.phase or 'Unknown'
-                        summary['by_phase'][phase] = summary['by_phase'].get(phase, 0) + 1
-
-                        # Calculate age
-                        age_seconds = None
-                        if pod.metadata.creation_timestamp:
-                            age_seconds = int((timezone.now() - pod.metadata.creation_timestamp).total_seconds())
-
-                        # Extract bot_id from pod name
-                        bot_id = None
-                        pod_name = pod.metadata.name
-                        if pod_name.startswith('bot-'):
-                            parts = pod_name.split('-')
-                            if len(parts) >= 2:
-                                for part in parts:
-                                    if part.startswith('bot_'):
-                                        bot_id = part
-                                        break
-
-                        # Container statuses
-                        container_statuses = []
-                        for cs in (pod.status.container_statuses or []):
-                            state = 'unknown'
-                            reason = None
-
-                            if cs.state:
-                                if cs.state.running:
-                                    state = 'running'
-                                elif cs.state.waiting:
-                                    state = 'waiting'
-                                    reason = cs.state.waiting.reason
-                                    if reason == 'CrashLoopBackOff':
-                                        summary['by_issue']['CrashLoopBackOff'] += 1
-                                    elif reason in ['ImagePullBackOff', 'ErrImagePull']:
-                                        summary['by_issue']['ImagePullBackOff'] += 1
-                                elif cs.state.terminated:
-                                    state = 'terminated'
-                                    reason = cs.state.terminated.reason
-                                    if reason == 'OOMKilled':
-                                        summary['by_issue']['OOMKilled'] += 1
-
-                            container_statuses.append({
-                                'name': cs.name,
-                                'ready': cs.ready,
-                                'restart_count': cs.restart_count,
-                                'state': state,
-                                'reason': reason,
-                            })
-
-                        # Track pending pods
-                        if phase == 'Pending' and age_seconds and age_seconds > 300:
-                            summary['by_issue']['Pending'] += 1
-
-                        pods_list.append({
-                            'name': pod_name,
-                            'namespace': ns,
-                            'phase': phase,
-                            'bot_id': bot_id,
-                            'node': pod.spec.node_name,
-                            'age_seconds': age_seconds,
-                            'container_statuses': container_statuses,
-                        })
-
-                except client.ApiException as e:
-                    logger.warning(f"Failed to list pods in namespace {ns}: {e}")
+            scan = _scan_pods(v1, namespaces)
 
             return JsonResponse({
-                'pods': pods_list,
-                'summary': summary,
+                'pods': scan['pods'],
+                'summary': scan['summary'],
             })
 
         except Exception as e:
@@ -418,8 +654,6 @@ class KubernetesAlertsAPI(View):
     """API for generating alerts from current cluster state."""
 
     def get(self, request):
-        from kubernetes import client
-
         alerts = []
 
         try:
@@ -440,8 +674,17 @@ class KubernetesAlertsAPI(View):
                     'summary': {'critical': 1, 'warning': 0, 'info': 0}
                 })
 
+            namespaces = [
+                getattr(settings, 'BOT_POD_NAMESPACE', 'attendee'),
+                getattr(settings, 'WEBPAGE_STREAMER_POD_NAMESPACE', 'attendee-webpage-streamer'),
+            ]
+            nodes_future = _K8S_POOL.submit(v1.list_node, resource_version=_FROM_CACHE)
+
+            # Check pods (shares its scan with KubernetesPodsAPI)
+            scan = _scan_pods(v1, namespaces)
+
             # Check nodes
-            nodes = v1.list_node()
+            nodes = nodes_future.result()
             for node in nodes.items:
                 node_name = node.metadata.name
                 for condition in (node.status.conditions or []):
@@ -461,15 +704,11 @@ class KubernetesAlertsAPI(View):
                                 'resource': node_name,
                             })
 
-            # Check pods
-            namespaces = [
-                getattr(settings, 'BOT_POD_NAMESPACE', 'attendee'),
-                getattr(settings, 'WEBPAGE_STREAMER_POD_NAMESPACE', 'attendee-webpage-streamer'),
-            ]
+            alerts.extend(scan['alerts'])
 
-            cpu_requested = 0
+            cpu_requested = scan['cpu_requested']
+            memory_requested = scan['memory_requested']
             cpu_allocatable = 0
-            memory_requested = 0
             memory_allocatable = 0
 
             # Get allocatable resources from nodes
@@ -478,74 +717,6 @@ class KubernetesAlertsAPI(View):
                 cpu_allocatable += _parse_cpu(allocatable.get('cpu', '0'))
                 memory_allocatable += _parse_memory(allocatable.get('memory', '0'))
 
-            for ns in namespaces:
-                try:
-                    pods = v1.list_namespaced_pod(namespace=ns)
-                    for pod in pods.items:
-                        pod_name = pod.metadata.name
-                        phase = pod.status.phase
-
-                        # Track resource requests
-                        if phase in ['Running', 'Pending']:
-                            for container in (pod.spec.containers or []):
-                                requests = (container.resources.requests or {}) if container.resources else {}
-                                cpu_requested += _parse_cpu(requests.get('cpu', '0'))
-                                memory_requested += _parse_memory(requests.get('memory', '0'))
-
-                        # Check for evicted/failed pods
-                        if phase == 'Failed':
-                            reason = pod.status.reason or 'Unknown'
-                            alerts.append({
-                                'severity': 'warning',
-                                'type': 'pod_failed',
-                                'message': f'Pod {pod_name} failed: {reason}',
-                                'resource': pod_name,
-                            })
-
-                        # Check container statuses
-                        for cs in (pod.status.container_statuses or []):
-                            if cs.restart_count > 3:
-                                alerts.append({
-                                    'severity': 'critical',
-                                    'type': 'pod_crash_loop',
-                                    'message': f'Pod {pod_name} container {cs.name} restarted {cs.restart_count} times',
-                                    'resource': pod_name,
-                                })
-
-                            if cs.state:
-                                if cs.state.waiting:
-                                    reason = cs.state.waiting.reason
-                                    if reason in ['ImagePullBackOff', 'ErrImagePull']:
-                                        alerts.append({
-                                            'severity': 'critical',
-                                            'type': 'pod_image_pull_error',
-                                            'message': f'Pod {pod_name} has {reason}',
-                                            'resource': pod_name,
-                                        })
-
-                                if cs.state.terminated and cs.state.terminated.reason == 'OOMKilled':
-                                    alerts.append({
-                                        'severity': 'warning',
-                                        'type': 'pod_oom_killed',
-                                        'message': f'Pod {pod_name} container {cs.name} was OOMKilled',
-                                        'resource': pod_name,
-                                    })
-
-                        # Pod pending too long (>5 min)
-                        if phase == 'Pending' and pod.metadata.creation_timestamp:
-                            age_seconds = (timezone.now() - pod.metadata.creation_timestamp).total_seconds()
-                            if age_seconds > 300:
-                                age_mins = int(age_seconds / 60)
-                                alerts.append({
-                                    'severity': 'warning',
-                                    'type': 'pod_pending_long',
-                                    'message': f'Pod {pod_name} pending for {age_mins} minutes',
-                                    'resource': pod_name,
-                                })
-
-                except client.ApiException as e:
-                    logger.warning(f"Failed to check pods in namespace {ns}: {e}")
-
             # Check resource exhaustion (>85%)
             if cpu_allocatable > 0:
                 cpu_pct = (cpu_requested / cpu_allocatable) * 100
@@ -618,30 +789,34 @@ class KubernetesBotLookupAPI(View):
         if bot:
             result['found'] = True
 
+            # last_heartbeat_timestamp is stored as integer epoch seconds
             heartbeat_age_seconds = None
+            last_heartbeat = None
             if bot.last_heartbeat_timestamp:
-                heartbeat_age_seconds = int((timezone.now() - bot.last_heartbeat_timestamp).total_seconds())
-
-            state_names = {s.value: s.label for s in BotStates}
+                heartbeat_age_seconds = int(time.time()) - bot.last_heartbeat_timestamp
+                last_heartbeat = datetime.fromtimestamp(bot.last_heartbeat_timestamp, tz=dt_timezone.utc).isoformat()
 
             result['bot'] = {
                 'object_id': bot.object_id,
-                'state': state_names.get(bot.state, f'Unknown({bot.state})'),
+                'state': _STATE_NAMES.get(bot.state, f'Unknown({bot.state})'),
                 'state_raw': bot.state,
                 'meeting_url': bot.meeting_url,
-                'last_heartbeat': bot.last_heartbeat_timestamp.isoformat() if bot.last_heartbeat_timestamp else None,
+                'last_heartbeat': last_heartbeat,
                 'heartbeat_age_seconds': heartbeat_age_seconds,
                 'join_at': bot.join_at.isoformat() if bot.join_at else None,
             }
 
             # Get recent bot events
-            recent_events = BotEvent.objects.filter(bot=bot).order_by('-created_at')[:10]
-            event_type_names = {e.value: e.label for e in BotEventTypes}
+            recent_events = (
+                BotEvent.objects.filter(bot=bot)
+                .order_by('-created_at')
+                .values('event_type', 'event_sub_type', 'created_at')[:10]
+            )
             result['events'] = [
                 {
-                    'type': event_type_names.get(e.event_type, f'Unknown({e.event_type})'),
-                    'sub_type': e.event_sub_type,
-                    'timestamp': e.created_at.isoformat(),
+                    'type': _EVENT_TYPE_NAMES.get(e['event_type'], f"Unknown({e['event_type']})"),
+                    'sub_type': e['event_sub_type'],
+                    'timestamp': e['created_at'].isoformat(),
                 }
                 for e in recent_events
             ]
@@ -658,6 +833,16 @@ class KubernetesBotLookupAPI(View):
             target_pod = None
             target_ns = None
 
+            # Pod names are derived from the bot record (see Bot.k8s_pod_name), so a
+            # known bot can be fetched by exact name instead of scanning the namespace.
+            predicted_names = {}
+            if bot_id and bot:
+                bot_pod_name = bot.k8s_pod_name()
+                predicted_names = {
+                    namespaces[0]: bot_pod_name,
+                    namespaces[1]: f'{bot_pod_name}-webpage-streamer',
+                }
+
             for ns in namespaces:
                 try:
                     if pod_name:
@@ -667,10 +852,24 @@ class KubernetesBotLookupAPI(View):
                             break
                         except client.ApiException:
                             continue
+                    elif predicted_names:
+                        pods = v1.list_namespaced_pod(
+                            namespace=ns,
+                            field_selector=f'metadata.name={predicted_names[ns]}',
+                            limit=1,
+                            resource_version=_FROM_CACHE,
+                        )
+                        if pods.items:
+                            target_pod = pods.items[0]
+                            target_ns = ns
+                            break
                     elif bot_id:
-                        pods = v1.list_namespaced_pod(namespace=ns)
+                        # No bot record to derive the name from; fall back to a scan
+                        # using the same normalisation as Bot.k8s_pod_name.
+                        name_fragment = bot_id.lower().replace('_', '-')
+                        pods = v1.list_namespaced_pod(namespace=ns, resource_version=_FROM_CACHE)
                         for pod in pods.items:
-                            if bot_id in pod.metadata.name:
+                            if name_fragment in pod.metadata.name:
                                 target_pod = pod
                                 target_ns = ns
                                 break
@@ -685,11 +884,18 @@ class KubernetesBotLookupAPI(View):
                 # Get pod events
                 pod_events = []
                 try:
+                    # A `limit` here would return the *oldest* page of events, so read
+                    # the (TTL-bounded) list from the watch cache and keep the newest 10.
                     events = v1.list_namespaced_event(
                         namespace=target_ns,
-                        field_selector=f'involvedObject.name={target_pod.metadata.name}'
+                        field_selector=f'involvedObject.name={target_pod.metadata.name}',
+                        resource_version=_FROM_CACHE,
                     )
-                    for event in events.items[-10:]:
+                    latest_events = sorted(
+                        events.items,
+                        key=lambda ev: ev.last_timestamp or ev.metadata.creation_timestamp or datetime.min.replace(tzinfo=dt_timezone.utc),
+                    )[-10:]
+                    for event in latest_events:
                         pod_events.append({
                             'type': event.type,
                             'reason': event.reason,
@@ -718,32 +924,41 @@ class KubernetesBotLookupAPI(View):
 class KubernetesNodesAPI(View):
     """API for node health details and capacity planning."""
 
+    CACHE_KEY = 'domain_wide:k8s_nodes'
+    CACHE_TTL_SECONDS = 10
+
     def get(self, request):
         from kubernetes import client
 
+        cached = cache.get(self.CACHE_KEY)
+        if cached is not None:
+            return JsonResponse(cached)
+
         try:
             v1 = _init_kubernetes_client()
 
             nodes_list = []
-            nodes = v1.list_node()
+            nodes = resource_cache.list_nodes(v1)
+            if nodes is None:
+                nodes = v1.list_node(resource_version=_FROM_CACHE).items
 
             # Get pod counts per node
             namespaces = [
                 getattr(settings, 'BOT_POD_NAMESPACE', 'attendee'),
                 getattr(settings, 'WEBPAGE_STREAMER_POD_NAMESPACE', 'attendee-webpage-streamer'),
             ]
-            pods_by_node = {}
-            for ns in namespaces:
+            # Only spec.nodeName is needed, so read the raw pod JSON rather than
+            # deserializing full V1Pod models
+            pods_by_node = Counter()
+            for ns, pods_future in _submit_pod_lists(v1, namespaces).items():
                 try:
-                    pods = v1.list_namespaced_pod(namespace=ns)
-                    for pod in pods.items:
-                        node_name = pod.spec.node_name
-                        if node_name:
-                            pods_by_node[node_name] = pods_by_node.get(node_name, 0) + 1
-                except Exception:
-                    pass
+                    pods = pods_future.result()
+                except client.ApiException as e:
+                    logger.warning(f"Failed to list pods in namespace {ns}: {e}")
+                    continue
+                pods_by_node.update(pod['spec']['nodeName'] for pod in pods if pod.get('spec', {}).get('nodeName'))
 
-            for node in nodes.items:
+            for node in nodes:
                 node_name = node.metadata.name
 
                 # Get conditions
@@ -780,9 +995,11 @@ class KubernetesNodesAPI(View):
                     'pod_count': pods_by_node.get(node_name, 0),
                 })
 
-            return JsonResponse({
+            payload = {
                 'nodes': nodes_list,
-            })
+            }
+            cache.set(self.CACHE_KEY, payload, self.CACHE_TTL_SECONDS)
+            return JsonResponse(payload)
 
         except Exception as e:
             logger.exception(f"Failed to get Kubernetes nodes: {e}")
@@ -792,10 +1009,20 @@ class KubernetesNodesAPI(View):
             }, status=500)
 
 
+# Normal events older than this are left off the events panel. Clusters can
+# run with a longer --event-ttl than the 1h default, so don't rely on expiry.
+_NORMAL_EVENT_WINDOW_SECONDS = 2 * 60 * 60
+
+# Most recent Warning events returned. Warnings are read from the watch cache,
+# which ignores `limit`, so the cap is applied after sorting by age.
+_MAX_WARNING_EVENTS = 200
+
+
 class KubernetesEventsAPI(View):
     """API for recent Kubernetes cluster events (warnings, errors)."""
 
     def get(self, request):
+        import urllib3
         from kubernetes import client
 
         try:
@@ -809,48 +1036,67 @@ class KubernetesEventsAPI(View):
             events_list = []
             event_counts = {'Normal': 0, 'Warning': 0}
 
-            for ns in namespaces:
-                try:
-                    events = v1.list_namespaced_event(
-                        namespace=ns,
-                        limit=100,
-                    )
+            # Warnings are always shown, so let the apiserver filter them out of
+            # the full history; Normal events come from the watch cache and are
+            # trimmed to recent ones below. All four lists are fetched concurrently.
+            event_futures = [
+                (ns, event_type, _K8S_POOL.submit(
+                    v1.list_namespaced_event,
+                    namespace=ns,
+                    field_selector=f'type={event_type}',
+                    resource_version=_FROM_CACHE,
+                    _request_timeout=5,
+                ))
+                for ns in namespaces
+                for event_type in ('Warning', 'Normal')
+            ]
 
-                    for event in events.items:
-                        event_type = event.type or 'Normal'
-                        event_counts[event_type] = event_counts.get(event_type, 0) + 1
+            # One clock read for the whole response; ages are plain float subtraction
+            now_ts = time.time()
+            normal_cutoff_ts = now_ts - _NORMAL_EVENT_WINDOW_SECONDS
 
-                        # Calculate age
-                        age_seconds = None
-                        event_time = event.last_timestamp or event.event_time or event.metadata.creation_timestamp
-                        if event_time:
-                            age_seconds = int((timezone.now() - event_time).total_seconds())
+            for ns, selected_type, future in event_futures:
+                # A failed or timed-out list only drops its own namespace and type
+                try:
+                    events = future.result().items
+                except (client.ApiException, urllib3.exceptions.HTTPError) as e:
+                    logger.warning(f"Failed to list {selected_type} events in namespace {ns}: {e}")
+                    continue
 
-                        # Only include recent events (last 2 hours) or warnings
-                        if age_seconds and age_seconds > 7200 and event_type == 'Normal':
+                for event in events:
+                    event_type = event.type or 'Normal'
+                    event_counts[event_type] = event_counts.get(event_type, 0) + 1
+
+                    # Only include recent events (last 2 hours) or warnings; skip
+                    # stale Normal events before doing any per-event work
+                    age_seconds = None
+                    event_time = event.last_timestamp or event.event_time or event.metadata.creation_timestamp
+                    if event_time:
+                        event_ts = event_time.timestamp()
+                        if event_type == 'Normal' and event_ts < normal_cutoff_ts:
                             continue
+                        age_seconds = int(now_ts - event_ts)
+
+                    events_list.append({
+                        'namespace': ns,
+                        'type': event_type,
+                        'reason': event.reason,
+                        'message': event.message[:200] if event.message else '',
+                        'object': f"{event.involved_object.kind}/{event.involved_object.name}" if event.involved_object else '',
+                        'count': event.count or 1,
+                        'age_seconds': age_seconds,
+                        'first_seen': event.first_timestamp.isoformat() if event.first_timestamp else None,
+                        'last_seen': event_time.isoformat() if event_time else None,
+                    })
 
-                        events_list.append({
-                            'namespace': ns,
-                            'type': event_type,
-                            'reason': event.reason,
-                            'message': event.message[:200] if event.message else '',
-                            'object': f"{event.involved_object.kind}/{event.involved_object.name}" if event.involved_object else '',
-                            'count': event.count or 1,
-                            'age_seconds': age_seconds,
-                            'first_seen': event.first_timestamp.isoformat() if event.first_timestamp else None,
-                            'last_seen': event_time.isoformat() if event_time else None,
-                        })
-
-                except client.ApiException as e:
-                    logger.warning(f"Failed to list events in namespace {ns}: {e}")
-
-            # Sort by recency (newest first)
-            events_list.sort(key=lambda x: x['age_seconds'] or 0)
+            # Separate warnings for prominence, newest first. Only the most recent
+            # warnings and 20 Normal events are shown, so select them without a
+            # full sort.
+            def age_key(e):
+                return e['age_seconds'] or 0
 
-            # Separate warnings for prominence
-            warnings = [e for e in events_list if e['type'] == 'Warning']
-            normal = [e for e in events_list if e['type'] == 'Normal'][:20]
+            warnings = heapq.nsmallest(_MAX_WARNING_EVENTS, (e for e in events_list if e['type'] == 'Warning'), key=age_key)
+            normal = heapq.nsmallest(20, (e for e in events_list if e['type'] == 'Normal'), key=age_key)
 
             return JsonResponse({
                 'events': warnings + normal,
@@ -871,24 +1117,33 @@ class KubernetesEventsAPI(View):
 class KubernetesDeploymentsAPI(View):
     """API for Kubernetes deployment status."""
 
+    CACHE_KEY = 'domain_wide:k8s_deployments'
+    CACHE_TTL_SECONDS = 10
+
     def get(self, request):
         from kubernetes import client
 
+        cached = cache.get(self.CACHE_KEY)
+        if cached is not None:
+            return JsonResponse(cached)
+
         try:
-            _init_kubernetes_client()
-            apps_v1 = client.AppsV1Api()
+            apps_v1 = _apps_v1()
 
             namespaces = [
                 getattr(settings, 'BOT_POD_NAMESPACE', 'attendee'),
             ]
 
             deployments_list = []
+            health_counts = Counter()
 
             for ns in namespaces:
                 try:
-                    deployments = apps_v1.list_namespaced_deployment(namespace=ns)
+                    deployments = resource_cache.list_deployments(apps_v1, ns)
+                    if deployments is None:
+                        deployments = apps_v1.list_namespaced_deployment(namespace=ns, resource_version=_FROM_CACHE).items
 
-                    for dep in deployments.items:
+                    for dep in deployments:
                         name = dep.metadata.name
                         spec_replicas = dep.spec.replicas or 0
                         status = dep.status
@@ -903,6 +1158,7 @@ class KubernetesDeploymentsAPI(View):
                             health = 'degraded'
                         if ready_replicas == 0 and spec_replicas > 0:
                             health = 'unhealthy'
+                        health_counts[health] += 1
 
                         # Check conditions
                         conditions = []
@@ -941,15 +1197,17 @@ class KubernetesDeploymentsAPI(View):
 
             summary = {
                 'total': len(deployments_list),
-                'healthy': len([d for d in deployments_list if d['health'] == 'healthy']),
-                'degraded': len([d for d in deployments_list if d['health'] == 'degraded']),
-                'unhealthy': len([d for d in deployments_list if d['health'] == 'unhealthy']),
+                'healthy': health_counts['healthy'],
+                'degraded': health_counts['degraded'],
+                'unhealthy': health_counts['unhealthy'],
             }
 
-            return JsonResponse({
+            payload = {
                 'deployments': deployments_list,
                 'summary': summary,
-            })
+            }
+            cache.set(self.CACHE_KEY, payload, self.CACHE_TTL_SECONDS)
+            return JsonResponse(payload)
 
         except Exception as e:
             logger.exception(f"Failed to get Kubernetes deployments: {e}")
@@ -963,12 +1221,19 @@ class KubernetesDeploymentsAPI(View):
 class KubernetesResourceMetricsAPI(View):
     """API for actual resource usage from metrics-server (if available)."""
 
+    CACHE_KEY = 'domain_wide:k8s_resource_metrics'
+    # metrics-server only scrapes about this often anyway
+    CACHE_TTL_SECONDS = 15
+
     def get(self, request):
         from kubernetes import client
 
+        cached = cache.get(self.CACHE_KEY)
+        if cached is not None:
+            return JsonResponse(cached)
+
         try:
-            _init_kubernetes_client()
-            custom_api = client.CustomObjectsApi()
+            custom_api = _custom_api()
 
             namespace = getattr(settings, 'BOT_POD_NAMESPACE', 'attendee')
 
@@ -1022,11 +1287,13 @@ class KubernetesResourceMetricsAPI(View):
                 else:
                     logger.warning(f"Failed to get pod metrics: {e}")
 
-            return JsonResponse({
+            payload = {
                 'metrics_available': len(node_metrics) > 0 or len(pod_metrics) > 0,
                 'node_metrics': node_metrics,
                 'pod_metrics': pod_metrics,
-            })
+            }
+            cache.set(self.CACHE_KEY, payload, self.CACHE_TTL_SECONDS)
+            return JsonResponse(payload)
 
         except Exception as e:
             logger.exception(f"Failed to get Kubernetes resource metrics: {e}")
@@ -1041,8 +1308,8 @@ class KubernetesResourceMetricsAPI(View):
 class SystemPodsAPI(View):
     """API for system (non-bot) pods with resource usage."""
 
-    # Known system pod name prefixes
-    SYSTEM_POD_PREFIXES = [
+    # `app` labels of the known system pods (see k8s/ and deploy/hetzner/manifests/)
+    SYSTEM_POD_APP_LABELS = [
         'attendee-api',
         'attendee-worker',
         'attendee-scheduler',
@@ -1052,27 +1319,45 @@ class SystemPodsAPI(View):
         'webpage-streamer',
     ]
 
+    CACHE_KEY = 'domain_wide:k8s_system_pods'
+    CACHE_TTL_SECONDS = 5
+
     def get(self, request):
-        from kubernetes import client
+        cached = cache.get(self.CACHE_KEY)
+        if cached is not None:
+            return JsonResponse(cached)
 
         try:
             v1 = _init_kubernetes_client()
 
             namespace = getattr(settings, 'BOT_POD_NAMESPACE', 'attendee')
-
-            pods = v1.list_namespaced_pod(namespace=namespace)
+            # Let the apiserver drop bot pods instead of shipping them all here
+            label_selector = f"app in ({','.join(self.SYSTEM_POD_APP_LABELS)})"
+
+            # Query metrics-server in the background while the pods are read
+            custom_api = _custom_api()
+            metrics_future = _K8S_POOL.submit(
+                custom_api.list_namespaced_custom_object,
+                group="metrics.k8s.io",
+                version="v1beta1",
+                namespace=namespace,
+                plural="pods",
+                label_selector=label_selector,
+            )
+
+            pods = resource_cache.list_pods(v1, namespace, label_selector=label_selector)
+            if pods is None:
+                pods = v1.list_namespaced_pod(
+                    namespace=namespace,
+                    label_selector=label_selector,
+                    resource_version=_FROM_CACHE,
+                ).items
             system_pods = []
 
             # Try to get metrics if available
             metrics_by_pod = {}
             try:
-                custom_api = client.CustomObjectsApi()
-                pod_metrics = custom_api.list_namespaced_custom_object(
-                    group="metrics.k8s.io",
-                    version="v1beta1",
-                    namespace=namespace,
-                    plural="pods"
-                )
+                pod_metrics = metrics_future.result()
                 for pm in pod_metrics.get('items', []):
                     pod_name = pm.get('metadata', {}).get('name')
                     containers = pm.get('containers', [])
@@ -1089,24 +1374,9 @@ class SystemPodsAPI(View):
             except Exception:
                 pass  # Metrics server may not be available
 
-            for pod in pods.items:
+            for pod in pods:
                 pod_name = pod.metadata.name
-
-                # Skip bot pods (they start with 'bot-')
-                if pod_name.startswith('bot-'):
-                    continue
-
-                # Check if it's a known system pod
-                is_system = False
-                service_name = pod_name
-                for prefix in self.SYSTEM_POD_PREFIXES:
-                    if pod_name.startswith(prefix):
-                        is_system = True
-                        service_name = prefix.replace('attendee-', '').capitalize()
-                        break
-
-                if not is_system:
-                    continue
+                service_name = (pod.metadata.labels or {}).get('app', pod_name).replace('attendee-', '').capitalize()
 
                 # Get pod status
                 phase = pod.status.phase or 'Unknown'
@@ -1143,10 +1413,12 @@ class SystemPodsAPI(View):
             # Sort by service name
             system_pods.sort(key=lambda x: x['name'])
 
-            return JsonResponse({
+            payload = {
                 'pods': system_pods,
                 'timestamp': timezone.now().isoformat(),
-            })
+            }
+            cache.set(self.CACHE_KEY, payload, self.CACHE_TTL_SECONDS)
+            return JsonResponse(payload)
 
         except Exception as e:
             logger.exception(f"Failed to get system pods: {e}")
@@ -1,51 +1,93 @@
 """
 Log streaming for Docker and Kubernetes.
 """
-import json as json_module
+import json
 import logging
-import os
+import random
 import re
+import time
 
 from django.conf import settings
 from django.http import StreamingHttpResponse
 from django.views import View
 
-from .kubernetes import _init_kubernetes_client
+from .kubernetes import _detect_infrastructure_mode, _init_kubernetes_client
 
 logger = logging.getLogger(__name__)
 
+_LEVELS = ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']
+# Order in which a line's level is decided when several keywords appear
+_LEVEL_PRIORITY = ['ERROR', 'WARNING', 'CRITICAL', 'DEBUG', 'INFO']
+_LEVEL_RE = re.compile(r'\b(ERROR|WARNING|CRITICAL|DEBUG|INFO)\b', re.IGNORECASE)
+# Max buffered lines across all pods in the all-bots stream
+_ALL_BOTS_QUEUE_SIZE = 1000
+
+# Consecutive reconnects without receiving a line before a pod log stream gives up
+_LOG_STREAM_MAX_RECONNECTS = 5
+
+
+def _iter_log_lines(chunks):
+    """
+    Reassemble a Docker log byte stream into decoded, stripped lines.
+
+    The SDK yields one chunk per multiplexed frame, which can hold several
+    lines or end mid-line, so split on newlines rather than per chunk.
+    """
+    buffer = b''
+    for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b'\n')
+        for line in lines:
+            yield line.decode('utf-8', errors='replace').strip()
+    if buffer:
+        yield buffer.decode('utf-8', errors='replace').strip()
+
+
+def _log_stamp_key(line):
+    """
+    Sort key for the RFC 3339 stamp that timestamps=True puts before each log
+    line, or None if the line has none. The kubelet trims trailing zeros from
+    the fraction, so pad it to nanoseconds before comparing.
+    """
+    space = line.find(' ')
+    stamp = line[:space] if space != -1 else line
+    if len(stamp) < 20 or stamp[10] != 'T' or not stamp.endswith('Z'):
+        return None
+    seconds, _, fraction = stamp[:-1].partition('.')
+    return seconds + fraction.ljust(9, '0')
+
+
+def _sse(payload):
+    """Frame a payload as a single Server-Sent Events message."""
+    return 'data: ' + json.dumps(payload) + '\n\n'
+
 
 class LogStreamView(View):
     """Server-Sent Events stream for live logs (Docker or Kubernetes)."""
 
     def _detect_mode(self):
         """Detect if running in Kubernetes or Docker mode."""
-        force_mode = os.getenv('INFRASTRUCTURE_MODE')
-        if force_mode in ('kubernetes', 'docker'):
-            return force_mode
-        if os.path.exists('/var/run/secrets/kubernetes.io/serviceaccount/token'):
-            return 'kubernetes'
-        if os.getenv('KUBERNETES_SERVICE_HOST'):
-            return 'kubernetes'
-        return 'docker'
+        return _detect_infrastructure_mode()
 
     def get(self, request):
         source = request.GET.get('source', 'scheduler')
         level = request.GET.get('level', 'INFO')
         mode = self._detect_mode()
 
-        def level_matches(line, min_level):
-            """Check if log line meets minimum level."""
-            levels = ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']
-            try:
-                min_idx = levels.index(min_level)
-            except ValueError:
-                min_idx = 1  # Default to INFO
+        # The requested level is fixed for the life of the stream
+        try:
+            min_idx = _LEVELS.index(level)
+        except ValueError:
+            min_idx = 1  # Default to INFO
+        unlabelled_matches = level in ['DEBUG', 'INFO']
 
-            for i, lvl in enumerate(levels):
-                if lvl in line.upper():
+        def level_matches(line):
+            """Check if log line meets minimum level."""
+            line_upper = line.upper()
+            for i, lvl in enumerate(_LEVELS):
+                if lvl in line_upper:
                     return i >= min_idx
-            return min_level in ['DEBUG', 'INFO']
+            return unlabelled_matches
 
         def parse_log_line(line):
             """Parse a log line and extract timestamp, level, message."""
@@ -57,17 +99,24 @@ class LogStreamView(View):
             elif 'diagnostic info:' in line.lower():
                 log_level = 'DEBUG'
             else:
-                # Look for log level indicators at word boundaries
-                for lvl in ['ERROR', 'WARNING', 'CRITICAL', 'DEBUG', 'INFO']:
-                    if re.search(rf'\b{lvl}\b', line.upper()):
-                        log_level = lvl
-                        break
+                # Look for log level indicators at word boundaries, in one regex pass
+                found = {m.upper() for m in _LEVEL_RE.findall(line)}
+                if found:
+                    for lvl in _LEVEL_PRIORITY:
+                        if lvl in found:
+                            log_level = lvl
+                            break
 
             timestamp = ''
-            ts_match = re.match(r'^(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})', line)
-            if ts_match:
-                timestamp = ts_match.group(1).split('T')[1][:8]
-                line = line[ts_match.end():].strip()
+            # timestamps=True prefixes every line with a fixed-layout RFC 3339
+            # stamp (YYYY-MM-DDTHH:MM:SS[.fraction]Z), so check the separators and
+            # slice instead of running a regex.
+            if (len(line) >= 19 and line[4] == '-' and line[7] == '-' and line[10] == 'T'
+                    and line[13] == ':' and line[16] == ':'):
+                timestamp = line[11:19]
+                # Drop the fractional seconds and zone along with the stamp
+                space = line.find(' ', 19)
+                line = (line[space + 1:] if space != -1 else line[19:]).strip()
 
             return timestamp, log_level, line[:500]
 
@@ -93,37 +142,56 @@ class LogStreamView(View):
                         # Aggregate logs from all bot pods
                         import threading
                         import queue
-                        from kubernetes import watch
 
-                        log_queue = queue.Queue()
+                        # Bounded so a chatty pod blocks its own reader instead of
+                        # growing the queue without limit
+                        log_queue = queue.Queue(maxsize=_ALL_BOTS_QUEUE_SIZE)
                         stop_event = threading.Event()
+                        responses = []
+
+                        def enqueue(item):
+                            while not stop_event.is_set():
+                                try:
+                                    log_queue.put(item, timeout=1)
+                                    return
+                                except queue.Full:
+                                    continue
 
                         def stream_pod_logs(pod_name, container_name):
                             try:
-                                w = watch.Watch()
-                                for line in w.stream(
-                                    v1.read_namespaced_pod_log,
+                                # Raw follow response, so the request can shut it
+                                # down and unblock a reader waiting on a quiet pod
+                                resp = v1.read_namespaced_pod_log(
                                     name=pod_name,
                                     namespace=namespace,
                                     container=container_name,
                                     follow=True,
                                     tail_lines=50,
                                     timestamps=True,
-                                    _request_timeout=300
-                                ):
-                                    if stop_event.is_set():
-                                        break
-                                    if line:
-                                        log_queue.put((pod_name, line))
+                                    _request_timeout=300,
+                                    _preload_content=False,
+                                )
+                                responses.append(resp)
+                                # The request may have finished while this one opened
+                                if stop_event.is_set():
+                                    resp.shutdown()
+                                try:
+                                    for line in _iter_log_lines(resp.stream(amt=None, decode_content=False)):
+                                        if stop_event.is_set():
+                                            break
+                                        if line:
+                                            enqueue((pod_name, line))
+                                finally:
+                                    resp.release_conn()
                             except Exception as e:
-                                log_queue.put((pod_name, f"[Stream error: {e}]"))
+                                enqueue((pod_name, f"[Stream error: {e}]"))
 
                         # Start threads for all bot pods
                         threads = []
                         bot_pods = [p for p in pods.items if p.metadata.name.startswith('bot-')]
 
                         if not bot_pods:
-                            yield f"data: {json_module.dumps({'message': 'No bot pods found', 'level': 'INFO', 'time': ''})}\n\n"
+                            yield _sse({'message': 'No bot pods found', 'level': 'INFO', 'time': ''})
                             return
 
                         for pod in bot_pods:
@@ -133,29 +201,34 @@ class LogStreamView(View):
                                 t.start()
                                 threads.append(t)
 
-                        yield f"data: {json_module.dumps({'message': f'Streaming logs from {len(threads)} bot pods...', 'level': 'INFO', 'time': ''})}\n\n"
+                        yield _sse({'message': f'Streaming logs from {len(threads)} bot pods...', 'level': 'INFO', 'time': ''})
 
-                        # Read from queue and yield
-                        while True:
-                            try:
-                                pod_name, line = log_queue.get(timeout=1)
-                                if not level_matches(line, level):
+                        # Read from queue and yield. The finally also runs when the
+                        # client disconnects and Django closes this generator; shutting
+                        # down the follow responses unblocks readers waiting on quiet
+                        # pods, so they don't outlive the request.
+                        try:
+                            while True:
+                                try:
+                                    pod_name, line = log_queue.get(timeout=1)
+                                    if not level_matches(line):
+                                        continue
+                                    timestamp, log_level, message = parse_log_line(line)
+                                    short_pod = pod_name.replace('bot-pod-', '').replace('bot-', '')[:20]
+                                    yield _sse({
+                                        'time': timestamp,
+                                        'level': log_level,
+                                        'message': f"[{short_pod}] {message}",
+                                        'pod': pod_name,
+                                    })
+                                except queue.Empty:
+                                    if not any(t.is_alive() for t in threads):
+                                        break
                                     continue
-                                timestamp, log_level, message = parse_log_line(line)
-                                short_pod = pod_name.replace('bot-pod-', '').replace('bot-', '')[:20]
-                                data = json_module.dumps({
-                                    'time': timestamp,
-                                    'level': log_level,
-                                    'message': f"[{short_pod}] {message}",
-                                    'pod': pod_name,
-                                })
-                                yield f"data: {data}\n\n"
-                            except queue.Empty:
-                                if not any(t.is_alive() for t in threads):
-                                    break
-                                continue
-
-                        stop_event.set()
+                        finally:
+                            stop_event.set()
+                            for resp in responses:
+                                resp.shutdown()
                         return
 
                     # Single pod streaming
@@ -171,7 +244,7 @@ class LogStreamView(View):
                                 break
 
                     if not target_pod:
-                        yield f"data: {json_module.dumps({'error': f'No pod found matching: {pod_pattern}'})}\n\n"
+                        yield _sse({'error': f'No pod found matching: {pod_pattern}'})
                         return
 
                     pod_name = target_pod.metadata.name
@@ -188,54 +261,85 @@ class LogStreamView(View):
                                 timestamps=True,
                             )
                             for line in logs.split('\n'):
-                                if not line or not level_matches(line, level):
+                                if not line or not level_matches(line):
                                     continue
                                 timestamp, log_level, message = parse_log_line(line)
-                                data = json_module.dumps({
+                                yield _sse({
                                     'time': timestamp,
                                     'level': log_level,
                                     'message': message,
                                     'pod': pod_name,
                                 })
-                                yield f"data: {data}\n\n"
-                            yield f"data: {json_module.dumps({'message': f'[End of logs - pod status: {target_pod.status.phase}]', 'level': 'INFO', 'time': ''})}\n\n"
+                            yield _sse({'message': f'[End of logs - pod status: {target_pod.status.phase}]', 'level': 'INFO', 'time': ''})
                         except Exception as e:
-                            yield f"data: {json_module.dumps({'error': f'Failed to get logs: {e}'})}\n\n"
+                            yield _sse({'error': f'Failed to get logs: {e}'})
                         return
 
-                    # Use watch to stream logs for running pods
+                    # Use watch to stream logs for running pods. The follow request
+                    # drops on read timeouts and connection resets; reopen it from
+                    # the last line received so the client doesn't miss output.
+                    import urllib3
                     from kubernetes import watch
-                    w = watch.Watch()
-
-                    for line in w.stream(
-                        v1.read_namespaced_pod_log,
-                        name=pod_name,
-                        namespace=namespace,
-                        container=container_name,
-                        follow=True,
-                        tail_lines=100,
-                        timestamps=True,
-                        _request_timeout=300
-                    ):
-                        if not line:
-                            continue
 
-                        if not level_matches(line, level):
-                            continue
+                    read_kwargs = {'tail_lines': 100}
+                    last_line_at = time.time()
+                    failed_reconnects = 0
+                    # since_seconds is whole seconds, so a reconnect replays up to a
+                    # second of lines; skip those at or before the last one received
+                    last_stamp_key = None
+                    resume_after_key = None
 
-                        timestamp, log_level, message = parse_log_line(line)
+                    while True:
+                        w = watch.Watch()
+                        try:
+                            for line in w.stream(
+                                v1.read_namespaced_pod_log,
+                                name=pod_name,
+                                namespace=namespace,
+                                container=container_name,
+                                follow=True,
+                                timestamps=True,
+                                _request_timeout=300,
+                                **read_kwargs
+                            ):
+                                last_line_at = time.time()
+                                failed_reconnects = 0
 
-                        data = json_module.dumps({
-                            'time': timestamp,
-                            'level': log_level,
-                            'message': message,
-                            'pod': pod_name,
-                        })
-                        yield f"data: {data}\n\n"
+                                if not line:
+                                    continue
+
+                                stamp_key = _log_stamp_key(line)
+                                if resume_after_key is not None and stamp_key is not None:
+                                    if stamp_key <= resume_after_key:
+                                        continue
+                                    resume_after_key = None
+                                if stamp_key is not None:
+                                    last_stamp_key = stamp_key
+
+                                if not level_matches(line):
+                                    continue
+
+                                timestamp, log_level, message = parse_log_line(line)
+
+                                yield _sse({
+                                    'time': timestamp,
+                                    'level': log_level,
+                                    'message': message,
+                                    'pod': pod_name,
+                                })
+                            # Stream ended on its own: the container has exited
+                            break
+                        except (urllib3.exceptions.ProtocolError, urllib3.exceptions.ReadTimeoutError):
+                            failed_reconnects += 1
+                            if failed_reconnects > _LOG_STREAM_MAX_RECONNECTS:
+                                raise
+                            time.sleep(random.uniform(0.5, 1.5))
+                            read_kwargs = {'since_seconds': int(time.time() - last_line_at) + 1}
+                            resume_after_key = last_stamp_key
 
                 except Exception as e:
                     logger.warning(f"K8s log stream error: {e}")
-                    yield f"data: {json_module.dumps({'error': str(e)})}\n\n"
+                    yield _sse({'error': str(e)})
 
             response = StreamingHttpResponse(k8s_log_stream(), content_type='text/event-stream')
 
@@ -262,7 +366,7 @@ class LogStreamView(View):
 
             if not container:
                 def error_stream():
-                    yield f"data: {json_module.dumps({'error': f'Container not found for source: {source}'})}\n\n"
+                    yield _sse({'error': f'Container not found for source: {source}'})
                 response = StreamingHttpResponse(error_stream(), content_type='text/event-stream')
                 response['Cache-Control'] = 'no-cache'
                 response['X-Accel-Buffering'] = 'no'
@@ -270,29 +374,24 @@ class LogStreamView(View):
 
             def docker_log_stream():
                 try:
-                    for line in container.logs(stream=True, follow=True, tail=100, timestamps=True):
-                        try:
-                            line = line.decode('utf-8').strip()
-                        except Exception:
-                            continue
-
+                    log_chunks = container.logs(stream=True, follow=True, tail=100, timestamps=True)
+                    for line in _iter_log_lines(log_chunks):
                         if not line:
                             continue
 
-                        if not level_matches(line, level):
+                        if not level_matches(line):
                             continue
 
                         timestamp, log_level, message = parse_log_line(line)
 
-                        data = json_module.dumps({
+                        yield _sse({
                             'time': timestamp,
                             'level': log_level,
                             'message': message,
                         })
-                        yield f"data: {data}\n\n"
 
                 except Exception as e:
-                    yield f"data: {json_module.dumps({'error': str(e)})}\n\n"
+                    yield _sse({'error': str(e)})
 
             response = StreamingHttpResponse(docker_log_stream(), content_type='text/event-stream')
 
@@ -3,51 +3,155 @@ OAuth flows for Google and Microsoft calendar integration.
 """
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
+from functools import lru_cache
+from urllib.parse import urlencode
 
 import requests
 from django.conf import settings
 from django.shortcuts import redirect, render
 from django.utils import timezone
 from django.views import View
+from google.auth import jwt as google_jwt
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from bots.models import Calendar
-from bots.tasks.sync_calendar_task import enqueue_sync_calendar_task
+from bots.domain_wide.tasks import enqueue_link_oauth_calendar_task
 
 logger = logging.getLogger(__name__)
 
 
+# (connect, read) timeouts for calls to the identity providers
+_OAUTH_HTTP_TIMEOUT = (5, 25)
+
+
+def _build_oauth_session():
+    """
+    Build the shared session for token exchange and userinfo calls.
+
+    Keep-alive pooling lets the userinfo call (and concurrent callbacks) reuse
+    the TLS connection opened for the token exchange. Retry's default
+    allowed_methods excludes POST, so a single-use auth code is never redeemed
+    twice.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=64,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504]),
+    )
+    session.mount('https://', adapter)
+    return session
+
+
+_oauth_session = _build_oauth_session()
+
+# Background pool for work that can overlap the provider round trips
+_OAUTH_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix='oauth')
+
+
+def _setting_or_env(name, default=None):
+    """Read a Django setting, falling back to the environment variable of the same name."""
+    return getattr(settings, name, None) or os.getenv(name, default)
+
+
+# OAuth app config doesn't change while the process runs, so resolve it once.
+# Call .cache_clear() after overriding these settings (e.g. in tests).
+@lru_cache(maxsize=1)
+def _google_oauth_config():
+    """Return (client_id, client_secret, redirect_uri) for Google OAuth."""
+    return (
+        _setting_or_env('GOOGLE_CLIENT_ID'),
+        _setting_or_env('GOOGLE_CLIENT_SECRET'),
+        _setting_or_env('GOOGLE_REDIRECT_URI'),
+    )
+
+
+@lru_cache(maxsize=1)
+def _microsoft_oauth_config():
+    """Return (client_id, client_secret, redirect_uri, tenant_id) for Microsoft OAuth."""
+    return (
+        _setting_or_env('MICROSOFT_CLIENT_ID'),
+        _setting_or_env('MICROSOFT_CLIENT_SECRET'),
+        _setting_or_env('MICROSOFT_REDIRECT_URI'),
+        _setting_or_env('MICROSOFT_TENANT_ID', 'common'),
+    )
+
+
+# The authorization URLs depend only on the OAuth config, so build them once.
+@lru_cache(maxsize=1)
+def _google_oauth_start_url():
+    """Return the Google authorization URL, or None if OAuth isn't configured."""
+    client_id, _, redirect_uri = _google_oauth_config()
+    if not client_id or not redirect_uri:
+        return None
+
+    params = {
+        'client_id': client_id,
+        'redirect_uri': redirect_uri,
+        'response_type': 'code',
+        'scope': 'openid email https://www.googleapis.com/auth/calendar.readonly',
+        'access_type': 'offline',
+        'prompt': 'consent',  # Force consent to get refresh token
+    }
+    return f"https://accounts.google.com/o/oauth2/v2/auth?{urlencode(params)}"
+
+
+@lru_cache(maxsize=1)
+def _microsoft_oauth_start_url():
+    """Return the Microsoft authorization URL, or None if OAuth isn't configured."""
+    client_id, _, redirect_uri, tenant_id = _microsoft_oauth_config()
+    if not client_id or not redirect_uri:
+        return None
+
+    params = {
+        'client_id': client_id,
+        'redirect_uri': redirect_uri,
+        'response_type': 'code',
+        'scope': 'openid email profile Calendars.Read offline_access',
+        'response_mode': 'query',
+    }
+    return f"https://login.microsoftonline.com/{tenant_id}/oauth2/v2.0/authorize?{urlencode(params)}"
+
+
+_GOOGLE_ID_TOKEN_ISSUERS = ('accounts.google.com', 'https://accounts.google.com')
+
+
+def _email_from_google_id_token(id_token, client_id):
+    """
+    Return the verified email from a Google id_token, or '' if it has none.
+
+    The token comes straight from Google's token endpoint over TLS, so per
+    OpenID Connect Core 3.1.3.7 the signature check can be skipped; the
+    audience and issuer are still checked.
+    """
+    if not id_token:
+        return ''
+    try:
+        claims = google_jwt.decode(id_token, verify=False)
+    except ValueError as e:
+        logger.warning(f"Could not decode Google id_token: {e}")
+        return ''
+    if claims.get('aud') != client_id or claims.get('iss') not in _GOOGLE_ID_TOKEN_ISSUERS:
+        logger.warning("Google id_token audience or issuer mismatch")
+        return ''
+    if not claims.get('email_verified'):
+        return ''
+    return claims.get('email', '').lower()
+
+
 class GoogleOAuthStart(View):
     """Initiate Google OAuth flow for individual calendar users."""
 
     def get(self, request):
-        import urllib.parse
-
-        client_id = (
-            getattr(settings, 'GOOGLE_CLIENT_ID', None)
-            or os.getenv('GOOGLE_CLIENT_ID')
-        )
-        redirect_uri = (
-            getattr(settings, 'GOOGLE_REDIRECT_URI', None)
-            or os.getenv('GOOGLE_REDIRECT_URI')
-        )
-
-        if not client_id or not redirect_uri:
+        oauth_url = _google_oauth_start_url()
+
+        if not oauth_url:
             return render(request, 'domain_wide/error.html', {
                 'error': 'Google OAuth not configured'
             }, status=500)
 
-        # Build OAuth URL
-        params = {
-            'client_id': client_id,
-            'redirect_uri': redirect_uri,
-            'response_type': 'code',
-            'scope': 'https://www.googleapis.com/auth/calendar.readonly https://www.googleapis.com/auth/userinfo.email',
-            'access_type': 'offline',
-            'prompt': 'consent',  # Force consent to get refresh token
-        }
-
-        oauth_url = f"https://accounts.google.com/o/oauth2/v2/auth?{urllib.parse.urlencode(params)}"
         return redirect(oauth_url)
 
 
@@ -73,9 +177,7 @@ class GoogleOAuthCallback(View):
             }, status=400)
 
         # Get OAuth config
-        client_id = getattr(settings, 'GOOGLE_CLIENT_ID', None) or os.getenv('GOOGLE_CLIENT_ID')
-        client_secret = getattr(settings, 'GOOGLE_CLIENT_SECRET', None) or os.getenv('GOOGLE_CLIENT_SECRET')
-        redirect_uri = getattr(settings, 'GOOGLE_REDIRECT_URI', None) or os.getenv('GOOGLE_REDIRECT_URI')
+        client_id, client_secret, redirect_uri = _google_oauth_config()
 
         if not all([client_id, client_secret, redirect_uri]):
             return render(request, 'domain_wide/error.html', {
@@ -84,7 +186,7 @@ class GoogleOAuthCallback(View):
 
         # Exchange code for tokens
         try:
-            token_response = requests.post(
+            token_response = _oauth_session.post(
                 'https://oauth2.googleapis.com/token',
                 data={
                     'code': code,
@@ -93,7 +195,7 @@ class GoogleOAuthCallback(View):
                     'redirect_uri': redirect_uri,
                     'grant_type': 'authorization_code',
                 },
-                timeout=30
+                timeout=_OAUTH_HTTP_TIMEOUT
             )
             token_response.raise_for_status()
             tokens = token_response.json()
@@ -112,21 +214,28 @@ class GoogleOAuthCallback(View):
                 'error': 'No access token received'
             }, status=500)
 
-        # Get user email from Google
-        try:
-            userinfo_response = requests.get(
-                'https://www.googleapis.com/oauth2/v2/userinfo',
-                headers={'Authorization': f'Bearer {access_token}'},
-                timeout=30
-            )
-            userinfo_response.raise_for_status()
-            userinfo = userinfo_response.json()
-            email = userinfo.get('email', '').lower()
-        except requests.RequestException as e:
-            logger.exception(f"Failed to get Google user info: {e}")
-            return render(request, 'domain_wide/error.html', {
-                'error': 'Failed to verify user identity'
-            }, status=500)
+        # Encrypt the tokens while the user's email is resolved
+        encrypted_access_future = _OAUTH_POOL.submit(encrypt_token, access_token)
+        encrypted_refresh_future = _OAUTH_POOL.submit(encrypt_token, refresh_token) if refresh_token else None
+
+        # The email normally comes from the id_token in the token response;
+        # fall back to the userinfo endpoint if it's missing or unverified
+        email = _email_from_google_id_token(tokens.get('id_token'), client_id)
+        if not email:
+            try:
+                userinfo_response = _oauth_session.get(
+                    'https://www.googleapis.com/oauth2/v2/userinfo',
+                    headers={'Authorization': f'Bearer {access_token}'},
+                    timeout=_OAUTH_HTTP_TIMEOUT
+                )
+                userinfo_response.raise_for_status()
+                userinfo = userinfo_response.json()
+                email = userinfo.get('email', '').lower()
+            except requests.RequestException as e:
+                logger.exception(f"Failed to get Google user info: {e}")
+                return render(request, 'domain_wide/error.html', {
+                    'error': 'Failed to verify user identity'
+                }, status=500)
 
         if not email:
             return render(request, 'domain_wide/error.html', {
@@ -139,8 +248,8 @@ class GoogleOAuthCallback(View):
                 email=email,
                 provider='google',
                 defaults={
-                    'access_token_encrypted': encrypt_token(access_token),
-                    'refresh_token_encrypted': encrypt_token(refresh_token) if refresh_token else '',
+                    'access_token_encrypted': encrypted_access_future.result(),
+                    'refresh_token_encrypted': encrypted_refresh_future.result() if encrypted_refresh_future else '',
                     'token_expiry': timezone.now() + timedelta(seconds=expires_in),
                     'scopes': ['calendar.readonly', 'userinfo.email'],
                 }
@@ -152,25 +261,11 @@ class GoogleOAuthCallback(View):
                 'error': 'Failed to save authorization'
             }, status=500)
 
-        # Create or link calendar in Attendee
+        # Calendar creation and initial sync don't need to block the success page
         try:
-            calendar, cal_created = Calendar.objects.get_or_create(
-                deduplication_key=f"{email}-google-oauth",
-                defaults={
-                    'platform': 'Google',
-                    'calendar_type': Calendar.GOOGLE_OAUTH if hasattr(Calendar, 'GOOGLE_OAUTH') else 1,
-                    'state': 1,  # ACTIVE
-                }
-            )
-            credential.calendar = calendar
-            credential.save(update_fields=['calendar'])
-
-            if cal_created:
-                logger.info(f"Created calendar for {email}")
-                # Trigger initial sync
-                enqueue_sync_calendar_task(calendar)
+            enqueue_link_oauth_calendar_task(credential.id)
         except Exception as e:
-            logger.exception(f"Failed to create calendar for {email}: {e}")
+            logger.exception(f"Failed to enqueue calendar linking for {email}: {e}")
             # Non-fatal - credentials are saved
 
         # Success page
@@ -184,36 +279,13 @@ class MicrosoftOAuthStart(View):
     """Initiate Microsoft OAuth flow for individual calendar users."""
 
     def get(self, request):
-        import urllib.parse
-
-        client_id = (
-            getattr(settings, 'MICROSOFT_CLIENT_ID', None)
-            or os.getenv('MICROSOFT_CLIENT_ID')
-        )
-        redirect_uri = (
-            getattr(settings, 'MICROSOFT_REDIRECT_URI', None)
-            or os.getenv('MICROSOFT_REDIRECT_URI')
-        )
-        tenant_id = (
-            getattr(settings, 'MICROSOFT_TENANT_ID', None)
-            or os.getenv('MICROSOFT_TENANT_ID', 'common')
-        )
-
-        if not client_id or not redirect_uri:
+        oauth_url = _microsoft_oauth_start_url()
+
+        if not oauth_url:
             return render(request, 'domain_wide/error.html', {
                 'error': 'Microsoft OAuth not configured'
             }, status=500)
 
-        # Build OAuth URL
-        params = {
-            'client_id': client_id,
-            'redirect_uri': redirect_uri,
-            'response_type': 'code',
-            'scope': 'openid email profile Calendars.Read offline_access',
-            'response_mode': 'query',
-        }
-
-        oauth_url = f"https://login.microsoftonline.com/{tenant_id}/oauth2/v2.0/authorize?{urllib.parse.urlencode(params)}"
         return redirect(oauth_url)
 
 
@@ -240,10 +312,7 @@ class MicrosoftOAuthCallback(View):
             }, status=400)
 
         # Get OAuth config
-        client_id = getattr(settings, 'MICROSOFT_CLIENT_ID', None) or os.getenv('MICROSOFT_CLIENT_ID')
-        client_secret = getattr(settings, 'MICROSOFT_CLIENT_SECRET', None) or os.getenv('MICROSOFT_CLIENT_SECRET')
-        redirect_uri = getattr(settings, 'MICROSOFT_REDIRECT_URI', None) or os.getenv('MICROSOFT_REDIRECT_URI')
-        tenant_id = getattr(settings, 'MICROSOFT_TENANT_ID', None) or os.getenv('MICROSOFT_TENANT_ID', 'common')
+        client_id, client_secret, redirect_uri, tenant_id = _microsoft_oauth_config()
 
         if not all([client_id, client_secret, redirect_uri]):
             return render(request, 'domain_wide/error.html', {
@@ -252,7 +321,7 @@ class MicrosoftOAuthCallback(View):
 
         # Exchange code for tokens
         try:
-            token_response = requests.post(
+            token_response = _oauth_session.post(
                 f'https://login.microsoftonline.com/{tenant_id}/oauth2/v2.0/token',
                 data={
                     'code': code,
@@ -262,7 +331,7 @@ class MicrosoftOAuthCallback(View):
                     'grant_type': 'authorization_code',
                     'scope': 'openid email profile Calendars.Read offline_access',
                 },
-                timeout=30
+                timeout=_OAUTH_HTTP_TIMEOUT
             )
             token_response.raise_for_status()
             tokens = token_response.json()
@@ -281,12 +350,16 @@ class MicrosoftOAuthCallback(View):
                 'error': 'No access token received'
             }, status=500)
 
+        # Encrypt the tokens while the userinfo request is in flight
+        encrypted_access_future = _OAUTH_POOL.submit(encrypt_token, access_token)
+        encrypted_refresh_future = _OAUTH_POOL.submit(encrypt_token, refresh_token) if refresh_token else None
+
         # Get user email from Microsoft Graph
         try:
-            userinfo_response = requests.get(
+            userinfo_response = _oauth_session.get(
                 'https://graph.microsoft.com/v1.0/me',
                 headers={'Authorization': f'Bearer {access_token}'},
-                timeout=30
+                timeout=_OAUTH_HTTP_TIMEOUT
             )
             userinfo_response.raise_for_status()
             userinfo = userinfo_response.json()
@@ -309,8 +382,8 @@ class MicrosoftOAuthCallback(View):
                 email=email,
                 provider='microsoft',
                 defaults={
-                    'access_token_encrypted': encrypt_token(access_token),
-                    'refresh_token_encrypted': encrypt_token(refresh_token) if refresh_token else '',
+                    'access_token_encrypted': encrypted_access_future.result(),
+                    'refresh_token_encrypted': encrypted_refresh_future.result() if encrypted_refresh_future else '',
                     'token_expiry': timezone.now() + timedelta(seconds=expires_in),
                     'scopes': ['Calendars.Read', 'offline_access'],
                 }
@@ -322,25 +395,11 @@ class MicrosoftOAuthCallback(View):
                 'error': 'Failed to save authorization'
             }, status=500)
 
-        # Create or link calendar in Attendee
+        # Calendar creation and initial sync don't need to block the success page
         try:
-            calendar, cal_created = Calendar.objects.get_or_create(
-                deduplication_key=f"{email}-microsoft-oauth",
-                defaults={
-                    'platform': 'Microsoft',
-                    'calendar_type': Calendar.MICROSOFT_OAUTH if hasattr(Calendar, 'MICROSOFT_OAUTH') else 2,
-                    'state': 1,  # ACTIVE
-                }
-            )
-            credential.calendar = calendar
-            credential.save(update_fields=['calendar'])
-
-            if cal_created:
-                logger.info(f"Created Microsoft calendar for {email}")
-                # Trigger initial sync
-                enqueue_sync_calendar_task(calendar)
+            enqueue_link_oauth_calendar_task(credential.id)
         except Exception as e:
-            logger.exception(f"Failed to create calendar for {email}: {e}")
+            logger.exception(f"Failed to enqueue calendar linking for {email}: {e}")
             # Non-fatal - credentials are saved
 
         # Success page
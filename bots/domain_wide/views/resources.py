@@ -1,22 +1,105 @@
 """
 Resource monitoring APIs for bot CPU/memory usage.
 """
+import heapq
+import json
 import logging
 import os
+import re
 from datetime import timedelta
+from datetime import timezone as dt_timezone
 
-from django.http import JsonResponse
+from django.core.cache import cache
+from django.db.models import Case, CharField, Count, FloatField, Max, OuterRef, Subquery, Value, When
+from django.db.models.fields.json import KeyTextTransform, KeyTransform
+from django.db.models.functions import Cast
+from django.http import JsonResponse, StreamingHttpResponse
 from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from django.utils.decorators import method_decorator
 from django.views import View
+from django.views.decorators.gzip import gzip_page
 
-from bots.models import Bot
+from bots.models import Bot, BotEvent, BotResourceSnapshot
 
 logger = logging.getLogger(__name__)
 
+# Bot pod resource limits; the env is fixed for the life of the process
+_CPU_LIMIT = int(os.getenv('BOT_CPU_REQUEST', '1500').rstrip('m'))
+_MEMORY_LIMIT_MB = int(float(os.getenv('BOT_MEMORY_LIMIT', '3Gi').rstrip('Gi')) * 1024)
 
+# bot_id query param: a numeric primary key or an object_id (bot_xxx / bot-xxx)
+_BOT_ID_RE = re.compile(r'^(?:(\d+)|bot[_-].+)$', re.IGNORECASE)
+
+
+def _lookup_bot(bot_id, *fields):
+    """Fetch a bot by numeric id or object_id (case-insensitive), loading only `fields`."""
+    match = _BOT_ID_RE.match(bot_id)
+    if not match:
+        raise Bot.DoesNotExist
+    bots = Bot.objects.only(*fields)
+    if match.group(1):
+        return bots.get(id=int(match.group(1)))
+    return bots.get(object_id__iexact=bot_id)
+
+
+def _format_cursor(created_at):
+    """Format a snapshot time as a URL-safe UTC cursor (no '+' offset to encode)."""
+    return created_at.astimezone(dt_timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.%fZ')
+
+
+# A '+HH:MM' offset sent unencoded arrives as ' HH:MM' right after the time
+_DECODED_PLUS_OFFSET_RE = re.compile(r'([T ]\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?) (\d{2}(?::?\d{2})?)$')
+
+
+def _parse_cursor(value):
+    """
+    Parse a `since` cursor into an aware datetime, or None if it isn't a valid
+    ISO 8601 timestamp. Naive timestamps are taken as UTC.
+    """
+    value = _DECODED_PLUS_OFFSET_RE.sub(r'\1+\2', value)
+    try:
+        parsed = parse_datetime(value)
+    except ValueError:
+        # Well-formed but out of range, e.g. month 13
+        return None
+    if parsed is not None and timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed, dt_timezone.utc)
+    return parsed
+
+
+# Display names for the BotEvent types shown on the resource timeline
+_EVENT_TYPE_NAMES = {
+    1: 'Waiting Room', 2: 'Joined', 3: 'Recording Granted',
+    4: 'Meeting Ended', 5: 'Left', 6: 'Join Requested',
+    7: 'Fatal Error', 9: 'Could Not Join', 12: 'Staged'
+}
+
+# Bot state -> outcome label. FATAL_ERROR (7) maps to None because it is
+# split into Crashed/Failed by the latest event's sub type.
+_STATE_OUTCOME = {
+    2: 'Running', 3: 'Running', 4: 'Running',  # Active states
+    7: None,  # FATAL_ERROR
+    9: 'Completed',  # ENDED
+}
+
+
+def _outcome_whens():
+    """CASE branches for the fixed-label states in _STATE_OUTCOME."""
+    states_by_label = {}
+    for state, label in _STATE_OUTCOME.items():
+        if label is not None:
+            states_by_label.setdefault(label, []).append(state)
+    return [When(state__in=states, then=Value(label)) for label, states in states_by_label.items()]
+
+
+@method_decorator(gzip_page, name='dispatch')
 class ResourceSummaryAPI(View):
     """Resource usage summary - shows peak CPU/memory for recent bots."""
 
+    CACHE_KEY = 'domain_wide:resource_summary:{hours}'
+    CACHE_TTL_SECONDS = 15
+
     def get(self, request):
         # Configurable time range: 1h, 6h, 24h, 7d
         hours_param = request.GET.get('hours', '24')
@@ -27,58 +110,65 @@ class ResourceSummaryAPI(View):
         except ValueError:
             hours = 24
 
-        cutoff = timezone.now() - timedelta(hours=hours)
+        cache_key = self.CACHE_KEY.format(hours=hours)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return JsonResponse(cached)
 
-        # Get current resource limits from environment
-        cpu_limit = int(os.getenv('BOT_CPU_REQUEST', '1500').rstrip('m'))
-        memory_limit_gb = float(os.getenv('BOT_MEMORY_LIMIT', '3Gi').rstrip('Gi'))
-        memory_limit_mb = int(memory_limit_gb * 1024)
+        cutoff = timezone.now() - timedelta(hours=hours)
 
-        # Get bots with resource snapshots in the time range
-        bots_with_snapshots = Bot.objects.filter(
-            resource_snapshots__created_at__gte=cutoff
-        ).distinct()
+        # Peak usage per bot over the time range, computed in one grouped query
+        peaks_by_bot = {
+            row['bot_id']: row
+            for row in BotResourceSnapshot.objects.filter(created_at__gte=cutoff)
+            .values('bot_id')
+            .annotate(
+                peak_memory=Max(Cast(KeyTextTransform('ram_usage_megabytes', 'data'), FloatField())),
+                peak_cpu=Max(Cast(KeyTextTransform('cpu_usage_millicores', 'data'), FloatField())),
+                snapshot_count=Count('id'),
+            )
+        }
+        # Outcome is classified in SQL. The latest event's sub type (Crashed vs
+        # Failed) sits in a nested CASE so it is only evaluated for FATAL_ERROR.
+        latest_event_sub_type = (
+            BotEvent.objects.filter(bot=OuterRef('pk'))
+            .order_by('-created_at')
+            .values('event_sub_type')[:1]
+        )
+        bots_with_snapshots = (
+            Bot.objects.filter(id__in=peaks_by_bot)
+            .only('id', 'object_id', 'state', 'join_at')
+            .alias(last_event_sub_type=Subquery(latest_event_sub_type))
+            .annotate(outcome=Case(
+                When(state=7, then=Case(
+                    When(last_event_sub_type=13, then=Value('Crashed')),  # HEARTBEAT_TIMEOUT
+                    default=Value('Failed'),
+                )),
+                *_outcome_whens(),
+                default=Value('Other'),
+                output_field=CharField(),
+            ))
+        )
 
         bot_resources = []
-        overall_peak_memory = 0
-        overall_peak_cpu = 0
+        high_memory_count = 0
+        high_cpu_count = 0
 
         for bot in bots_with_snapshots:
-            snapshots = bot.resource_snapshots.filter(created_at__gte=cutoff)
-            if not snapshots.exists():
-                continue
-
-            peak_memory = 0
-            peak_cpu = 0
-            snapshot_count = 0
-
-            for snapshot in snapshots:
-                data = snapshot.data
-                ram = data.get('ram_usage_megabytes', 0)
-                cpu = data.get('cpu_usage_millicores', 0)
-                if ram > peak_memory:
-                    peak_memory = ram
-                if cpu > peak_cpu:
-                    peak_cpu = cpu
-                snapshot_count += 1
-
-            # Determine outcome
-            if bot.state == 7:  # FATAL_ERROR
-                last_event = bot.bot_events.order_by('-created_at').first()
-                if last_event and last_event.event_sub_type == 13:  # HEARTBEAT_TIMEOUT
-                    outcome = 'Crashed'
-                else:
-                    outcome = 'Failed'
-            elif bot.state == 9:  # ENDED
-                outcome = 'Completed'
-            elif bot.state in [2, 3, 4]:  # Active states
-                outcome = 'Running'
-            else:
-                outcome = 'Other'
+            peaks = peaks_by_bot[bot.id]
+            peak_memory = peaks['peak_memory'] or 0
+            peak_cpu = peaks['peak_cpu'] or 0
+            snapshot_count = peaks['snapshot_count']
 
             # Calculate percentages
-            memory_pct = round((peak_memory / memory_limit_mb) * 100, 1) if memory_limit_mb > 0 else 0
-            cpu_pct = round((peak_cpu / cpu_limit) * 100, 1) if cpu_limit > 0 else 0
+            memory_pct = round((peak_memory / _MEMORY_LIMIT_MB) * 100, 1) if _MEMORY_LIMIT_MB > 0 else 0
+            cpu_pct = round((peak_cpu / _CPU_LIMIT) * 100, 1) if _CPU_LIMIT > 0 else 0
+
+            # Count bots approaching limits
+            if memory_pct >= 80:
+                high_memory_count += 1
+            if cpu_pct >= 80:
+                high_cpu_count += 1
 
             bot_resources.append({
                 'bot_id': bot.id,
@@ -88,118 +178,141 @@ class ResourceSummaryAPI(View):
                 'peak_cpu_millicores': peak_cpu,
                 'peak_cpu_pct': cpu_pct,
                 'snapshot_count': snapshot_count,
-                'outcome': outcome,
+                'outcome': bot.outcome,
                 'state': bot.state,
                 'join_at': bot.join_at.isoformat() if bot.join_at else None,
             })
 
-            if peak_memory > overall_peak_memory:
-                overall_peak_memory = peak_memory
-            if peak_cpu > overall_peak_cpu:
-                overall_peak_cpu = peak_cpu
-
-        # Sort by peak memory descending
-        bot_resources.sort(key=lambda x: x['peak_memory_mb'], reverse=True)
+        overall_peak_memory = max((b['peak_memory_mb'] for b in bot_resources), default=0)
+        overall_peak_cpu = max((b['peak_cpu_millicores'] for b in bot_resources), default=0)
 
-        # Count bots approaching limits
-        high_memory_count = sum(1 for b in bot_resources if b['peak_memory_pct'] >= 80)
-        high_cpu_count = sum(1 for b in bot_resources if b['peak_cpu_pct'] >= 80)
+        # Top 50 by peak memory, descending
+        top_bots = heapq.nlargest(50, bot_resources, key=lambda x: x['peak_memory_mb'])
 
-        return JsonResponse({
+        payload = {
             'time_range_hours': hours,
             'limits': {
-                'cpu_millicores': cpu_limit,
-                'memory_mb': memory_limit_mb,
+                'cpu_millicores': _CPU_LIMIT,
+                'memory_mb': _MEMORY_LIMIT_MB,
             },
             'summary': {
                 'total_bots_with_data': len(bot_resources),
                 'peak_memory_mb': overall_peak_memory,
-                'peak_memory_pct': round((overall_peak_memory / memory_limit_mb) * 100, 1) if memory_limit_mb > 0 else 0,
+                'peak_memory_pct': round((overall_peak_memory / _MEMORY_LIMIT_MB) * 100, 1) if _MEMORY_LIMIT_MB > 0 else 0,
                 'peak_cpu_millicores': overall_peak_cpu,
-                'peak_cpu_pct': round((overall_peak_cpu / cpu_limit) * 100, 1) if cpu_limit > 0 else 0,
+                'peak_cpu_pct': round((overall_peak_cpu / _CPU_LIMIT) * 100, 1) if _CPU_LIMIT > 0 else 0,
                 'high_memory_count': high_memory_count,
                 'high_cpu_count': high_cpu_count,
             },
-            'bots': bot_resources[:50],  # Limit to top 50
+            'bots': top_bots,
             'timestamp': timezone.now().isoformat(),
-        })
+        }
+        cache.set(cache_key, payload, self.CACHE_TTL_SECONDS)
+        return JsonResponse(payload)
 
 
+@method_decorator(gzip_page, name='dispatch')
 class BotResourcesAPI(View):
     """Detailed resource time-series for a specific bot."""
 
+    DEFAULT_PAGE_SIZE = 500
+    MAX_PAGE_SIZE = 5000
+
     def get(self, request):
         bot_id = request.GET.get('bot_id')
         if not bot_id:
             return JsonResponse({'error': 'bot_id parameter required'}, status=400)
 
         try:
-            # Support both numeric ID and object_id (case-insensitive)
-            if bot_id.startswith('bot_') or bot_id.startswith('bot-'):
-                bot = Bot.objects.get(object_id__iexact=bot_id)
-            else:
-                bot = Bot.objects.get(id=int(bot_id))
-        except (Bot.DoesNotExist, ValueError):
+            bot = _lookup_bot(bot_id, 'id', 'object_id', 'state', 'join_at', 'meeting_url')
+        except Bot.DoesNotExist:
             return JsonResponse({'error': 'Bot not found'}, status=404)
 
-        # Get current resource limits
-        cpu_limit = int(os.getenv('BOT_CPU_REQUEST', '1500').rstrip('m'))
-        memory_limit_gb = float(os.getenv('BOT_MEMORY_LIMIT', '3Gi').rstrip('Gi'))
-        memory_limit_mb = int(memory_limit_gb * 1024)
-
-        # Get all snapshots for this bot
-        snapshots = bot.resource_snapshots.order_by('created_at')
+        # Optional cursor paging: ?since=<ISO timestamp>&limit=<n>. Without either
+        # parameter the whole series is returned, as the dashboard chart expects.
+        since_param = request.GET.get('since')
+        limit_param = request.GET.get('limit')
+        paginated = since_param is not None or limit_param is not None
+        since = None
+        if since_param:
+            since = _parse_cursor(since_param)
+            if since is None:
+                return JsonResponse({'error': 'since must be an ISO 8601 timestamp'}, status=400)
+        limit = None
+        if paginated:
+            try:
+                limit = min(max(int(limit_param or self.DEFAULT_PAGE_SIZE), 1), self.MAX_PAGE_SIZE)
+            except ValueError:
+                return JsonResponse({'error': 'limit must be an integer'}, status=400)
+
+        # Time series: pull just the two numbers out of each snapshot's JSON in SQL
+        # instead of loading the whole payload (including the process list)
+        snapshot_rows = (
+            bot.resource_snapshots.order_by('created_at')
+            .values_list('created_at', KeyTransform('ram_usage_megabytes', 'data'), KeyTransform('cpu_usage_millicores', 'data'))
+        )
+        if since is not None:
+            snapshot_rows = snapshot_rows.filter(created_at__gt=since)
+        if limit is not None:
+            # One extra row tells us whether there is a next page
+            snapshot_rows = snapshot_rows[:limit + 1]
+        snapshot_rows = list(snapshot_rows)
+        next_cursor = None
+        if limit is not None and len(snapshot_rows) > limit:
+            snapshot_rows.pop()
+            next_cursor = _format_cursor(snapshot_rows[-1][0])
+        time_series = [
+            {
+                'timestamp': created_at.isoformat(),
+                'memory_mb': ram or 0,
+                'cpu_millicores': cpu or 0,
+            }
+            for created_at, ram, cpu in snapshot_rows
+        ]
+
+        if paginated:
+            # A page only covers part of the series; take the peaks over all of it
+            peaks = bot.resource_snapshots.aggregate(
+                peak_memory=Max(Cast(KeyTextTransform('ram_usage_megabytes', 'data'), FloatField())),
+                peak_cpu=Max(Cast(KeyTextTransform('cpu_usage_millicores', 'data'), FloatField())),
+            )
+            peak_memory = peaks['peak_memory'] or 0
+            peak_cpu = peaks['peak_cpu'] or 0
+        else:
+            peak_memory = max((point['memory_mb'] for point in time_series), default=0)
+            peak_cpu = max((point['cpu_millicores'] for point in time_series), default=0)
 
-        time_series = []
-        peak_memory = 0
-        peak_cpu = 0
+        # Process list from the earliest snapshot at peak memory
         peak_processes = []
-
-        for snapshot in snapshots:
-            data = snapshot.data
-            ram = data.get('ram_usage_megabytes', 0)
-            cpu = data.get('cpu_usage_millicores', 0)
-            processes = data.get('processes', [])
-
-            time_series.append({
-                'timestamp': snapshot.created_at.isoformat(),
-                'memory_mb': ram,
-                'cpu_millicores': cpu,
-            })
-
-            if ram > peak_memory:
-                peak_memory = ram
-                peak_processes = processes
-            if cpu > peak_cpu:
-                peak_cpu = cpu
+        if peak_memory > 0:
+            peak_processes = (
+                bot.resource_snapshots.order_by(
+                    Cast(KeyTextTransform('ram_usage_megabytes', 'data'), FloatField()).desc(nulls_last=True),
+                    'created_at',
+                )
+                .values_list(KeyTransform('processes', 'data'), flat=True)
+                .first()
+            ) or []
 
         # Get bot events for context
         events = []
-        for event in bot.bot_events.order_by('created_at'):
-            event_type_names = {
-                1: 'Waiting Room', 2: 'Joined', 3: 'Recording Granted',
-                4: 'Meeting Ended', 5: 'Left', 6: 'Join Requested',
-                7: 'Fatal Error', 9: 'Could Not Join', 12: 'Staged'
-            }
+        last_event = None
+        for event in bot.bot_events.only('created_at', 'event_type', 'event_sub_type').order_by('created_at'):
+            last_event = event
             events.append({
                 'timestamp': event.created_at.isoformat(),
-                'type': event_type_names.get(event.event_type, f'Event {event.event_type}'),
+                'type': _EVENT_TYPE_NAMES.get(event.event_type, f'Event {event.event_type}'),
                 'sub_type': event.event_sub_type,
             })
 
         # Determine outcome
-        if bot.state == 7:
-            last_event = bot.bot_events.order_by('-created_at').first()
+        outcome = _STATE_OUTCOME.get(bot.state, f'State {bot.state}')
+        if outcome is None:
+            # Events are ordered oldest first, so the loop above left the latest one
             if last_event and last_event.event_sub_type == 13:
                 outcome = 'Crashed (Heartbeat Timeout)'
             else:
                 outcome = 'Failed'
-        elif bot.state == 9:
-            outcome = 'Completed'
-        elif bot.state in [2, 3, 4]:
-            outcome = 'Running'
-        else:
-            outcome = f'State {bot.state}'
 
         return JsonResponse({
             'bot': {
@@ -211,17 +324,18 @@ class BotResourcesAPI(View):
                 'meeting_url': bot.meeting_url,
             },
             'limits': {
-                'cpu_millicores': cpu_limit,
-                'memory_mb': memory_limit_mb,
+                'cpu_millicores': _CPU_LIMIT,
+                'memory_mb': _MEMORY_LIMIT_MB,
             },
             'peak': {
                 'memory_mb': peak_memory,
-                'memory_pct': round((peak_memory / memory_limit_mb) * 100, 1) if memory_limit_mb > 0 else 0,
+                'memory_pct': round((peak_memory / _MEMORY_LIMIT_MB) * 100, 1) if _MEMORY_LIMIT_MB > 0 else 0,
                 'cpu_millicores': peak_cpu,
-                'cpu_pct': round((peak_cpu / cpu_limit) * 100, 1) if cpu_limit > 0 else 0,
+                'cpu_pct': round((peak_cpu / _CPU_LIMIT) * 100, 1) if _CPU_LIMIT > 0 else 0,
                 'processes': peak_processes,
             },
             'time_series': time_series,
+            'next_cursor': next_cursor,
             'events': events,
             'timestamp': timezone.now().isoformat(),
         })
@@ -238,36 +352,44 @@ class BotActivityLogAPI(View):
             return JsonResponse({'error': 'bot_id parameter required'}, status=400)
 
         try:
-            if bot_id.startswith('bot_') or bot_id.startswith('bot-'):
-                bot = Bot.objects.get(object_id__iexact=bot_id)
-            else:
-                bot = Bot.objects.get(id=int(bot_id))
-        except (Bot.DoesNotExist, ValueError):
+            bot = _lookup_bot(bot_id, 'id', 'object_id', 'state')
+        except Bot.DoesNotExist:
             return JsonResponse({'error': 'Bot not found'}, status=404)
 
-        # Get activity logs
-        activities = BotActivityLog.objects.filter(bot=bot).order_by('created_at')
+        # Get activity logs, streamed in chunks so long timelines aren't held in memory
+        activities = (
+            BotActivityLog.objects.filter(bot=bot)
+            .order_by('created_at')
+            .values_list('created_at', 'activity_type', 'message', 'elapsed_ms')
+            .iterator(chunk_size=500)
+        )
+        activity_type_names = dict(BotActivityLog.ActivityType.choices)
 
         # Determine if we should show the timeline (only for failed bots)
         is_failed = bot.state == BotStates.FATAL_ERROR
 
-        return JsonResponse({
-            'bot_id': bot.object_id,
-            'state': bot.get_state_display(),
-            'is_failed': is_failed,
-            'show_timeline': is_failed or activities.exists(),  # Show if failed OR has any logs
-            'activities': [
-                {
-                    'timestamp': a.created_at.isoformat(),
-                    'time_display': a.created_at.strftime('%H:%M:%S'),
-                    'type': a.get_activity_type_display(),
-                    'type_code': a.activity_type,
-                    'message': a.message,
-                    'elapsed_ms': a.elapsed_ms,
-                    'elapsed_display': f'+{a.elapsed_ms}ms' if a.elapsed_ms else None,
-                    'is_error': a.activity_type >= 10 and a.activity_type < 20,
-                }
-                for a in activities
-            ],
-            'timestamp': timezone.now().isoformat(),
-        })
+        def activity_log_json():
+            yield '{"bot_id": ' + json.dumps(bot.object_id)
+            yield ', "state": ' + json.dumps(bot.get_state_display())
+            yield ', "is_failed": ' + json.dumps(is_failed)
+            yield ', "activities": ['
+            has_activities = False
+            for created_at, activity_type, message, elapsed_ms in activities:
+                timestamp = created_at.isoformat()
+                yield (', ' if has_activities else '') + json.dumps({
+                    'timestamp': timestamp,
+                    'time_display': timestamp[11:19],  # HH:MM:SS
+                    'type': activity_type_names.get(activity_type, activity_type),
+                    'type_code': activity_type,
+                    'message': message,
+                    'elapsed_ms': elapsed_ms,
+                    'elapsed_display': f'+{elapsed_ms}ms' if elapsed_ms else None,
+                    'is_error': 10 <= activity_type < 20,
+                })
+                has_activities = True
+            yield ']'
+            # Emitted after the list so it needs no separate exists() query
+            yield ', "show_timeline": ' + json.dumps(is_failed or has_activities)  # Show if failed OR has any logs
+            yield ', "timestamp": ' + json.dumps(timezone.now().isoformat()) + '}'
+
+        return StreamingHttpResponse(activity_log_json(), content_type='application/json')
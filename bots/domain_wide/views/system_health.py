@@ -1,15 +1,17 @@
 """
 System health and pipeline monitoring APIs.
 """
-import json
 import logging
-import os
 import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 from datetime import datetime, timedelta
 
 from django.conf import settings
+from django.core.cache import cache
 from django.db import connection
-from django.db.models import Count, Exists, Max, OuterRef, Subquery
+from django.db.models import Count, Exists, Max, Min, OuterRef, Q, Subquery
+from django.db.models.fields.json import KeyTextTransform
 from django.http import JsonResponse
 from django.utils import timezone
 from django.views import View
@@ -18,127 +20,168 @@ from bots.models import (
     Bot, BotStates, Recording, RecordingStates, RecordingTranscriptionStates,
 )
 
-from .kubernetes import _init_kubernetes_client
+from .k8s_cache import resource_cache
+from .kubernetes import _FROM_CACHE, _detect_infrastructure_mode, _init_kubernetes_client
 
 logger = logging.getLogger(__name__)
 
+# SystemHealthAPI runs its Celery and K8s/Docker probes concurrently
+_HEALTH_PROBE_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix='health_probe')
+_HEALTH_PROBE_TIMEOUT_SECONDS = 10
 
-class ActiveIssuesAPI(View):
-    """API for detecting active issues that need attention."""
+_ACTIVE_ISSUES_CACHE_KEY = 'domain_wide:active_issues'
+_ACTIVE_ISSUES_CACHE_TTL_SECONDS = 10
 
-    def get(self, request):
-        from bots.models import (
-            AsyncTranscription, AsyncTranscriptionStates,
-            Utterance, ZoomOAuthConnection, ZoomOAuthConnectionStates
-        )
-        from ..models import OAuthCredential
 
-        now = timezone.now()
-        issues = {
-            'has_issues': False,
-            'total_count': 0,
-            'stuck_bots': {'count': 0, 'by_state': []},
-            'heartbeat_timeout_bots': {'count': 0, 'bots': []},
-            'orphaned_recordings': {'count': 0},
-            'stalled_transcriptions': {'count': 0},
-            'stuck_transcript_sync': {'count': 0, 'bots': []}
-        }
+def _compute_active_issues():
+    """
+    Detect active issues that need attention.
 
-        # Stuck bots - bots that have been in certain states too long
-        stuck_thresholds = {
-            BotStates.JOINING: 15,           # minutes
-            BotStates.WAITING_ROOM: 30,
-            BotStates.POST_PROCESSING: 60,
-            BotStates.LEAVING: 10,
-        }
+    Shared by ActiveIssuesAPI and SystemHealthAPI's issues_count, and cached
+    briefly so both endpoints polling together run the queries once.
+    """
+    cached = cache.get(_ACTIVE_ISSUES_CACHE_KEY)
+    if cached is not None:
+        return cached
+
+    from bots.models import AsyncTranscription, AsyncTranscriptionStates
+
+    now = timezone.now()
+    issues = {
+        'has_issues': False,
+        'total_count': 0,
+        'stuck_bots': {'count': 0, 'by_state': []},
+        'heartbeat_timeout_bots': {'count': 0, 'bots': []},
+        'orphaned_recordings': {'count': 0},
+        'stalled_transcriptions': {'count': 0},
+        'stuck_transcript_sync': {'count': 0, 'bots': []}
+    }
+
+    # Stuck bots - bots that have been in certain states too long
+    stuck_thresholds = {
+        BotStates.JOINING: 15,           # minutes
+        BotStates.WAITING_ROOM: 30,
+        BotStates.POST_PROCESSING: 60,
+        BotStates.LEAVING: 10,
+    }
+
+    # One grouped query for all states, each with its own age cutoff
+    stuck_filter = Q()
+    for state, threshold in stuck_thresholds.items():
+        stuck_filter |= Q(state=state, updated_at__lt=now - timedelta(minutes=threshold))
+    stuck_by_state = {
+        row['state']: row
+        for row in Bot.objects.filter(stuck_filter)
+        .values('state')
+        .annotate(count=Count('id'), oldest=Min('updated_at'))
+    }
+
+    for state, threshold in stuck_thresholds.items():
+        row = stuck_by_state.get(state)
+        if row:
+            oldest_age = int((now - row['oldest']).total_seconds() / 60)
+            state_name = BotStates(state).label
+            issues['stuck_bots']['by_state'].append({
+                'state': state_name,
+                'state_raw': state,
+                'threshold_minutes': threshold,
+                'count': row['count'],
+                'oldest_age_minutes': oldest_age
+            })
+            issues['stuck_bots']['count'] += row['count']
+
+    # Heartbeat timeout bots - bots with stale heartbeats that aren't in post-meeting states
+    heartbeat_timeout_seconds = 600  # 10 minutes
+    heartbeat_cutoff = int(now.timestamp()) - heartbeat_timeout_seconds
+    heartbeat_timeout = Bot.objects.filter(
+        last_heartbeat_timestamp__lt=heartbeat_cutoff,
+        last_heartbeat_timestamp__isnull=False
+    ).exclude(state__in=BotStates.post_meeting_states())
+
+    # Fetch the 10 stalest with just the columns shown; ordering on the
+    # heartbeat lets the partial index serve the LIMIT. Only count separately
+    # when there may be more.
+    timeout_bots = list(
+        heartbeat_timeout.only('object_id', 'state', 'last_heartbeat_timestamp')
+        .order_by('last_heartbeat_timestamp')[:10]
+    )
+    timeout_count = len(timeout_bots) if len(timeout_bots) < 10 else heartbeat_timeout.count()
+    if timeout_count > 0:
+        state_names = {s.value: s.label for s in BotStates}
+        issues['heartbeat_timeout_bots']['count'] = timeout_count
+        issues['heartbeat_timeout_bots']['bots'] = [
+            {
+                'object_id': b.object_id,
+                'state': state_names.get(b.state, f'Unknown({b.state})'),
+                'last_heartbeat_age_seconds': int(now.timestamp()) - b.last_heartbeat_timestamp
+            }
+            for b in timeout_bots
+        ]
+
+    # These are almost always empty, so check for any match (which stops at
+    # the first row) before paying for a full count
+
+    # Orphaned recordings - recordings in progress/paused but bot is in post-meeting state
+    orphaned = Recording.objects.filter(
+        state__in=[RecordingStates.IN_PROGRESS, RecordingStates.PAUSED],
+        bot__state__in=BotStates.post_meeting_states()
+    )
+    if orphaned.exists():
+        issues['orphaned_recordings']['count'] = orphaned.count()
+
+    # Stalled transcriptions - in progress for more than 30 minutes
+    stalled_cutoff = now - timedelta(minutes=30)
+    stalled = AsyncTranscription.objects.filter(
+        state=AsyncTranscriptionStates.IN_PROGRESS,
+        updated_at__lt=stalled_cutoff
+    )
+    if stalled.exists():
+        issues['stalled_transcriptions']['count'] = stalled.count()
+
+    # Stuck transcript sync - recordings COMPLETE but transcription still IN_PROGRESS for >60 min
+    stuck_sync_cutoff = now - timedelta(minutes=60)
+    stuck_sync = Recording.objects.filter(
+        state=RecordingStates.COMPLETE,
+        transcription_state=RecordingTranscriptionStates.IN_PROGRESS,
+        updated_at__lt=stuck_sync_cutoff,
+        bot__state=BotStates.ENDED
+    )
+    stuck_sync_recordings = list(
+        stuck_sync.select_related('bot').only('id', 'updated_at', 'bot__object_id')[:10]
+    )
+    stuck_sync_count = (
+        len(stuck_sync_recordings) if len(stuck_sync_recordings) < 10 else stuck_sync.count()
+    )
+    if stuck_sync_count > 0:
+        issues['stuck_transcript_sync']['count'] = stuck_sync_count
+        issues['stuck_transcript_sync']['bots'] = [
+            {
+                'bot_id': r.bot.object_id,
+                'recording_id': r.id,
+                'age_minutes': int((now - r.updated_at).total_seconds() / 60)
+            }
+            for r in stuck_sync_recordings
+        ]
 
-        for state, threshold in stuck_thresholds.items():
-            cutoff = now - timedelta(minutes=threshold)
-            stuck = Bot.objects.filter(
-                state=state,
-                updated_at__lt=cutoff
-            )
-            count = stuck.count()
-            if count > 0:
-                oldest = stuck.order_by('updated_at').first()
-                oldest_age = int((now - oldest.updated_at).total_seconds() / 60) if oldest else 0
-                state_name = BotStates(state).label
-                issues['stuck_bots']['by_state'].append({
-                    'state': state_name,
-                    'state_raw': state,
-                    'threshold_minutes': threshold,
-                    'count': count,
-                    'oldest_age_minutes': oldest_age
-                })
-                issues['stuck_bots']['count'] += count
-
-        # Heartbeat timeout bots - bots with stale heartbeats that aren't in post-meeting states
-        heartbeat_timeout_seconds = 600  # 10 minutes
-        heartbeat_cutoff = int(now.timestamp()) - heartbeat_timeout_seconds
-        heartbeat_timeout = Bot.objects.filter(
-            last_heartbeat_timestamp__lt=heartbeat_cutoff,
-            last_heartbeat_timestamp__isnull=False
-        ).exclude(state__in=BotStates.post_meeting_states())
-
-        timeout_count = heartbeat_timeout.count()
-        if timeout_count > 0:
-            state_names = {s.value: s.label for s in BotStates}
-            issues['heartbeat_timeout_bots']['count'] = timeout_count
-            issues['heartbeat_timeout_bots']['bots'] = [
-                {
-                    'object_id': b.object_id,
-                    'state': state_names.get(b.state, f'Unknown({b.state})'),
-                    'last_heartbeat_age_seconds': int(now.timestamp()) - b.last_heartbeat_timestamp
-                }
-                for b in heartbeat_timeout[:10]
-            ]
+    # Calculate totals
+    issues['total_count'] = (
+        issues['stuck_bots']['count'] +
+        issues['heartbeat_timeout_bots']['count'] +
+        issues['orphaned_recordings']['count'] +
+        issues['stalled_transcriptions']['count'] +
+        issues['stuck_transcript_sync']['count']
+    )
+    issues['has_issues'] = issues['total_count'] > 0
 
-        # Orphaned recordings - recordings in progress/paused but bot is in post-meeting state
-        orphaned = Recording.objects.filter(
-            state__in=[RecordingStates.IN_PROGRESS, RecordingStates.PAUSED],
-            bot__state__in=BotStates.post_meeting_states()
-        ).count()
-        issues['orphaned_recordings']['count'] = orphaned
+    cache.set(_ACTIVE_ISSUES_CACHE_KEY, issues, _ACTIVE_ISSUES_CACHE_TTL_SECONDS)
+    return issues
 
-        # Stalled transcriptions - in progress for more than 30 minutes
-        stalled_cutoff = now - timedelta(minutes=30)
-        stalled = AsyncTranscription.objects.filter(
-            state=AsyncTranscriptionStates.IN_PROGRESS,
-            updated_at__lt=stalled_cutoff
-        ).count()
-        issues['stalled_transcriptions']['count'] = stalled
-
-        # Stuck transcript sync - recordings COMPLETE but transcription still IN_PROGRESS for >60 min
-        stuck_sync_cutoff = now - timedelta(minutes=60)
-        stuck_sync = Recording.objects.filter(
-            state=RecordingStates.COMPLETE,
-            transcription_state=RecordingTranscriptionStates.IN_PROGRESS,
-            updated_at__lt=stuck_sync_cutoff,
-            bot__state=BotStates.ENDED
-        ).select_related('bot')
-        stuck_sync_count = stuck_sync.count()
-        if stuck_sync_count > 0:
-            issues['stuck_transcript_sync']['count'] = stuck_sync_count
-            issues['stuck_transcript_sync']['bots'] = [
-                {
-                    'bot_id': r.bot.object_id,
-                    'recording_id': r.id,
-                    'age_minutes': int((now - r.updated_at).total_seconds() / 60)
-                }
-                for r in stuck_sync[:10]
-            ]
-
-        # Calculate totals
-        issues['total_count'] = (
-            issues['stuck_bots']['count'] +
-            issues['heartbeat_timeout_bots']['count'] +
-            issues['orphaned_recordings']['count'] +
-            issues['stalled_transcriptions']['count'] +
-            issues['stuck_transcript_sync']['count']
-        )
-        issues['has_issues'] = issues['total_count'] > 0
 
-        return JsonResponse(issues)
+class ActiveIssuesAPI(View):
+    """API for detecting active issues that need attention."""
+
+    def get(self, request):
+        return JsonResponse(_compute_active_issues())
 
 
 class MeetingSyncStatusAPI(View):
@@ -150,6 +193,11 @@ class MeetingSyncStatusAPI(View):
     - Phase 2: Transcription COMPLETE → Transcript synced (transcript_status='complete')
     """
 
+    # Each response costs a Supabase round-trip over every ended bot's id;
+    # share it between pollers
+    CACHE_KEY = 'domain_wide:meeting_sync_status:{date}'
+    CACHE_TTL_SECONDS = 30
+
     def get(self, request):
         from ..supabase_client import get_supabase_client
 
@@ -160,6 +208,11 @@ class MeetingSyncStatusAPI(View):
         else:
             target_date = timezone.now().date()
 
+        cache_key = self.CACHE_KEY.format(date=target_date.isoformat())
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return JsonResponse(cached)
+
         # Get all ended bots for the date (including fatal errors)
         # Only count bots that:
         # 1. Have join_at in the past (actually scheduled to run)
@@ -175,21 +228,20 @@ class MeetingSyncStatusAPI(View):
 
         total_ended = ended_bots.count()
 
-        # Get recording stats for ended bots
-        ended_bot_ids = list(ended_bots.values_list('id', flat=True))
-
-        recordings = Recording.objects.filter(bot_id__in=ended_bot_ids)
-
-        # Recording states
-        rec_complete = recordings.filter(state=RecordingStates.COMPLETE).count()
+        # Get recording stats for ended bots; the bot filter runs as a subquery
+        recordings = Recording.objects.filter(bot__in=ended_bots)
+
+        # Recording and transcription states for the ended bots, in one query
+        stats = recordings.aggregate(
+            rec_complete=Count('id', filter=Q(state=RecordingStates.COMPLETE)),
+            rec_failed=Count('id', filter=Q(state=RecordingStates.FAILED)),
+            trans_complete=Count('id', filter=Q(transcription_state=RecordingTranscriptionStates.COMPLETE)),
+            trans_in_progress=Count('id', filter=Q(transcription_state=RecordingTranscriptionStates.IN_PROGRESS)),
+            trans_failed=Count('id', filter=Q(transcription_state=RecordingTranscriptionStates.FAILED)),
+            trans_not_started=Count('id', filter=Q(transcription_state=RecordingTranscriptionStates.NOT_STARTED)),
+        )
+        # In-progress recordings are counted across all bots, not just the ended ones
         rec_in_progress = Recording.objects.filter(state=RecordingStates.IN_PROGRESS).count()
-        rec_failed = recordings.filter(state=RecordingStates.FAILED).count()
-
-        # Transcription states
-        trans_complete = recordings.filter(transcription_state=RecordingTranscriptionStates.COMPLETE).count()
-        trans_in_progress = recordings.filter(transcription_state=RecordingTranscriptionStates.IN_PROGRESS).count()
-        trans_failed = recordings.filter(transcription_state=RecordingTranscriptionStates.FAILED).count()
-        trans_not_started = recordings.filter(transcription_state=RecordingTranscriptionStates.NOT_STARTED).count()
 
         # Try to get Supabase sync status
         supabase_stats = {
@@ -237,48 +289,157 @@ class MeetingSyncStatusAPI(View):
                 transcription_state=RecordingTranscriptionStates.COMPLETE
             ).values_list('bot__object_id', flat=True)
 
+            # supabase_meetings is keyed by every synced bot, so one dict probe
+            # covers both "never synced" and "still pending"
             for bot_id in complete_trans_bots:
-                if bot_id not in [m['attendee_bot_id'] for m in (result.data or [])]:
-                    stuck_count += 1
-                elif supabase_meetings.get(bot_id) == 'pending':
+                if bot_id not in supabase_meetings or supabase_meetings[bot_id] == 'pending':
                     stuck_count += 1
 
-        return JsonResponse({
+        payload = {
             'date': target_date.isoformat(),
             'total_ended_bots': total_ended,
             'recording_states': {
-                'complete': rec_complete,
+                'complete': stats['rec_complete'],
                 'in_progress': rec_in_progress,
-                'failed': rec_failed,
+                'failed': stats['rec_failed'],
             },
             'transcription_states': {
-                'complete': trans_complete,
-                'in_progress': trans_in_progress,
-                'failed': trans_failed,
-                'not_started': trans_not_started,
+                'complete': stats['trans_complete'],
+                'in_progress': stats['trans_in_progress'],
+                'failed': stats['trans_failed'],
+                'not_started': stats['trans_not_started'],
             },
             'supabase_sync': supabase_stats,
             'stuck_meetings': stuck_count,
             'timestamp': timezone.now().isoformat(),
-        })
+        }
+        cache.set(cache_key, payload, self.CACHE_TTL_SECONDS)
+        return JsonResponse(payload)
 
 
 class SystemHealthAPI(View):
     """API for system-wide health status at a glance."""
 
+    # The probes below hit Celery, the K8s API and Docker; share one result
+    # between pollers
+    CACHE_KEY = 'domain_wide:system_health'
+    CACHE_TTL_SECONDS = 10
+
+    # `app` labels set by the scheduler/worker Deployments (k8s/ and deploy/hetzner/)
+    PLATFORM_POD_SELECTOR = 'app in (attendee-scheduler,attendee-worker)'
+
     def _detect_mode(self):
         """Detect if running in Kubernetes or Docker mode."""
-        force_mode = os.getenv('INFRASTRUCTURE_MODE')
-        if force_mode in ('kubernetes', 'docker'):
-            return force_mode
-        if os.path.exists('/var/run/secrets/kubernetes.io/serviceaccount/token'):
-            return 'kubernetes'
-        if os.getenv('KUBERNETES_SERVICE_HOST'):
-            return 'kubernetes'
-        return 'docker'
+        return _detect_infrastructure_mode()
+
+    def _check_celery(self):
+        """Ping Redis/Celery; returns the 'redis' and 'worker' sections."""
+        redis = {'status': 'unknown', 'connected': False}
+        worker = {'status': 'unknown', 'pod_running': False, 'active_tasks': 0}
+        try:
+            from attendee.celery import app as celery_app
+            inspect = celery_app.control.inspect(timeout=2)
+            ping_result = inspect.ping()
+            if ping_result:
+                redis['status'] = 'healthy'
+                redis['connected'] = True
+
+                active_workers = inspect.active()
+                if active_workers:
+                    worker['pod_running'] = True
+                    worker['status'] = 'healthy'
+                    worker['active_tasks'] = sum(len(tasks) for tasks in active_workers.values())
+                else:
+                    worker['status'] = 'degraded'
+            else:
+                redis['status'] = 'error'
+                worker['status'] = 'error'
+        except Exception as e:
+            redis['status'] = 'error'
+            worker['status'] = 'error'
+            logger.warning(f"Celery/Redis health check failed: {e}")
+        return {'redis': redis, 'worker': worker}
+
+    def _check_kubernetes(self):
+        """Check the K8s API, nodes and scheduler/worker pods."""
+        k8s_api = {'status': 'unknown', 'latency_ms': None, 'nodes_ready': '0/0'}
+        scheduler = {'status': 'unknown', 'pod_running': False}
+        worker_running = False
+        try:
+            v1 = _init_kubernetes_client()
+
+            # API latency
+            start = time.time()
+            v1.list_namespace(limit=1)
+            latency = int((time.time() - start) * 1000)
+            k8s_api['status'] = 'healthy'
+            k8s_api['latency_ms'] = latency
+
+            # Node status, from the shared watch cache when it's warm
+            nodes = resource_cache.list_nodes(v1)
+            if nodes is None:
+                nodes = v1.list_node(resource_version=_FROM_CACHE).items
+            ready_count = 0
+            total_count = len(nodes)
+            for node in nodes:
+                for cond in (node.status.conditions or []):
+                    if cond.type == 'Ready' and cond.status == 'True':
+                        ready_count += 1
+                        break
+            k8s_api['nodes_ready'] = f'{ready_count}/{total_count}'
+
+            # Check scheduler/worker pods; the label selector keeps bot pods out
+            # of the response
+            namespace = getattr(settings, 'BOT_POD_NAMESPACE', 'attendee')
+            pods = resource_cache.list_pods(v1, namespace, label_selector=self.PLATFORM_POD_SELECTOR)
+            if pods is None:
+                pods = v1.list_namespaced_pod(
+                    namespace=namespace,
+                    label_selector=self.PLATFORM_POD_SELECTOR,
+                    resource_version=_FROM_CACHE,
+                ).items
+            for pod in pods:
+                app = (pod.metadata.labels or {}).get('app')
+                phase = pod.status.phase
+                if app == 'attendee-scheduler':
+                    scheduler['pod_running'] = phase == 'Running'
+                    scheduler['status'] = 'healthy' if phase == 'Running' else 'error'
+                elif app == 'attendee-worker':
+                    if phase == 'Running':
+                        worker_running = True
+
+        except Exception as e:
+            k8s_api['status'] = 'error'
+            logger.warning(f"K8s health check failed: {e}")
+        return {'k8s_api': k8s_api, 'scheduler': scheduler, 'worker_running': worker_running}
+
+    def _check_docker(self):
+        """Check the scheduler/worker containers."""
+        scheduler = {'status': 'unknown', 'pod_running': False}
+        worker_running = False
+        try:
+            import docker
+            docker_client = docker.from_env()
+            for container in docker_client.containers.list():
+                name = container.name.lower()
+                if 'scheduler' in name and container.status == 'running':
+                    scheduler['pod_running'] = True
+                    scheduler['status'] = 'healthy'
+                elif 'worker' in name and container.status == 'running':
+                    worker_running = True
+            docker_client.close()
+        except Exception as e:
+            logger.warning(f"Docker health check failed: {e}")
+        return {
+            'k8s_api': {'status': 'n/a', 'latency_ms': None, 'nodes_ready': '0/0'},
+            'scheduler': scheduler,
+            'worker_running': worker_running,
+        }
 
     def get(self, request):
-        from kubernetes import client
+        cached = cache.get(self.CACHE_KEY)
+        if cached is not None:
+            return JsonResponse(cached)
 
         mode = self._detect_mode()
         health = {
@@ -292,6 +453,13 @@ class SystemHealthAPI(View):
             'timestamp': timezone.now().isoformat()
         }
 
+        # The Celery and infrastructure probes are independent network calls;
+        # run them in the background while the database checks run here
+        celery_future = _HEALTH_PROBE_POOL.submit(self._check_celery)
+        infra_future = _HEALTH_PROBE_POOL.submit(
+            self._check_kubernetes if mode == 'kubernetes' else self._check_docker
+        )
+
         # Database health - simple ping with timing
         try:
             start = time.time()
@@ -304,96 +472,36 @@ class SystemHealthAPI(View):
             health['database']['status'] = 'error'
             logger.warning(f"Database health check failed: {e}")
 
-        # Redis/Celery health
+        # Get issues count
         try:
-            from attendee.celery import app as celery_app
-            inspect = celery_app.control.inspect(timeout=2)
-            ping_result = inspect.ping()
-            if ping_result:
-                health['redis']['status'] = 'healthy'
-                health['redis']['connected'] = True
-
-                active_workers = inspect.active()
-                if active_workers:
-                    health['worker']['pod_running'] = True
-                    health['worker']['status'] = 'healthy'
-                    health['worker']['active_tasks'] = sum(len(tasks) for tasks in active_workers.values())
-                else:
-                    health['worker']['status'] = 'degraded'
-            else:
-                health['redis']['status'] = 'error'
-                health['worker']['status'] = 'error'
+            health['issues_count'] = _compute_active_issues()['total_count']
         except Exception as e:
+            logger.warning(f"Failed to get issues count: {e}")
+
+        # Redis/Celery health
+        try:
+            health.update(celery_future.result(timeout=_HEALTH_PROBE_TIMEOUT_SECONDS))
+        except FuturesTimeoutError:
             health['redis']['status'] = 'error'
             health['worker']['status'] = 'error'
-            logger.warning(f"Celery/Redis health check failed: {e}")
-
-        # Kubernetes health (if in K8s mode)
-        if mode == 'kubernetes':
-            try:
-                v1 = _init_kubernetes_client()
-
-                # API latency
-                start = time.time()
-                v1.list_namespace(limit=1)
-                latency = int((time.time() - start) * 1000)
-                health['k8s_api']['status'] = 'healthy'
-                health['k8s_api']['latency_ms'] = latency
-
-                # Node status
-                nodes = v1.list_node()
-                ready_count = 0
-                total_count = len(nodes.items)
-                for node in nodes.items:
-                    for cond in (node.status.conditions or []):
-                        if cond.type == 'Ready' and cond.status == 'True':
-                            ready_count += 1
-                            break
-                health['k8s_api']['nodes_ready'] = f'{ready_count}/{total_count}'
-
-                # Check scheduler pod
-                namespace = getattr(settings, 'BOT_POD_NAMESPACE', 'attendee')
-                pods = v1.list_namespaced_pod(namespace=namespace)
-                for pod in pods.items:
-                    name = pod.metadata.name
-                    phase = pod.status.phase
-                    if 'scheduler' in name:
-                        health['scheduler']['pod_running'] = phase == 'Running'
-                        health['scheduler']['status'] = 'healthy' if phase == 'Running' else 'error'
-                    elif 'worker' in name and 'webpage' not in name:
-                        if phase == 'Running':
-                            health['worker']['pod_running'] = True
-                            if health['worker']['status'] != 'healthy':
-                                health['worker']['status'] = 'healthy'
+            logger.warning("Celery/Redis health check timed out")
 
-            except Exception as e:
-                health['k8s_api']['status'] = 'error'
-                logger.warning(f"K8s health check failed: {e}")
-        else:
-            # Docker mode - check containers
-            health['k8s_api']['status'] = 'n/a'
-            try:
-                import docker
-                docker_client = docker.from_env()
-                for container in docker_client.containers.list():
-                    name = container.name.lower()
-                    if 'scheduler' in name and container.status == 'running':
-                        health['scheduler']['pod_running'] = True
-                        health['scheduler']['status'] = 'healthy'
-                    elif 'worker' in name and container.status == 'running':
-                        health['worker']['pod_running'] = True
-                docker_client.close()
-            except Exception as e:
-                logger.warning(f"Docker health check failed: {e}")
-
-        # Get issues count from ActiveIssuesAPI
+        # Kubernetes or Docker health; a running worker pod/container counts
+        # even if Celery didn't answer
         try:
-            issues_response = ActiveIssuesAPI().get(request)
-            issues_data = json.loads(issues_response.content)
-            health['issues_count'] = issues_data.get('total_count', 0)
-        except Exception as e:
-            logger.warning(f"Failed to get issues count: {e}")
+            infra = infra_future.result(timeout=_HEALTH_PROBE_TIMEOUT_SECONDS)
+        except FuturesTimeoutError:
+            health['k8s_api']['status'] = 'error' if mode == 'kubernetes' else 'n/a'
+            logger.warning(f"{mode} health check timed out")
+        else:
+            health['k8s_api'] = infra['k8s_api']
+            health['scheduler'] = infra['scheduler']
+            if infra['worker_running']:
+                health['worker']['pod_running'] = True
+                if mode == 'kubernetes':
+                    health['worker']['status'] = 'healthy'
 
+        cache.set(self.CACHE_KEY, health, self.CACHE_TTL_SECONDS)
         return JsonResponse(health)
 
 
@@ -416,64 +524,67 @@ class ProcessingPipelineAPI(View):
             updated_at__gte=day_ago
         )
 
-        # Count failures by reason
+        # Count failures by reason, grouped in the database. failure_data is only
+        # ever set to a non-empty dict, so the groups add up to the 24h total.
         failure_reasons = {}
-        for utterance in failed_utterances_24h[:500]:
-            if utterance.failure_data:
-                reason = utterance.failure_data.get('reason', 'unknown')
-                failure_reasons[reason] = failure_reasons.get(reason, 0) + 1
-
-        # Utterances processed today
-        utterances_completed_today = Utterance.objects.filter(
-            transcription__isnull=False,
-            updated_at__date=today
-        ).count()
+        failed_utterances_count = 0
+        reason_counts = (
+            failed_utterances_24h
+            .annotate(reason=KeyTextTransform('reason', 'failure_data'))
+            .values('reason')
+            .annotate(count=Count('id'))
+            .values_list('reason', 'count')
+        )
+        for reason, count in reason_counts:
+            reason = reason or 'unknown'
+            failure_reasons[reason] = failure_reasons.get(reason, 0) + count
+            failed_utterances_count += count
+
+        # One conditional-aggregate query per table instead of a count() per number
+        utterance_stats = Utterance.objects.aggregate(
+            completed_today=Count('id', filter=Q(transcription__isnull=False, updated_at__date=today)),
+            pending=Count('id', filter=Q(transcription__isnull=True, failure_data__isnull=True)),
+        )
+        recording_stats = Recording.objects.aggregate(
+            in_progress=Count('id', filter=Q(state=RecordingStates.IN_PROGRESS)),
+            completed_today=Count('id', filter=Q(state=RecordingStates.COMPLETE, completed_at__date=today)),
+            failed_today=Count('id', filter=Q(state=RecordingStates.FAILED, updated_at__date=today)),
+            transcription_in_progress=Count(
+                'id', filter=Q(transcription_state=RecordingTranscriptionStates.IN_PROGRESS)
+            ),
+            transcription_failed_today=Count(
+                'id', filter=Q(transcription_state=RecordingTranscriptionStates.FAILED, updated_at__date=today)
+            ),
+        )
+        async_stats = AsyncTranscription.objects.aggregate(
+            not_started=Count('id', filter=Q(state=AsyncTranscriptionStates.NOT_STARTED)),
+            in_progress=Count('id', filter=Q(state=AsyncTranscriptionStates.IN_PROGRESS)),
+            failed_today=Count('id', filter=Q(state=AsyncTranscriptionStates.FAILED, updated_at__date=today)),
+        )
 
         # DeepGram credentials status
-        deepgram_creds = Credentials.objects.filter(credential_type=Credentials.CredentialTypes.DEEPGRAM)
-        deepgram_total = deepgram_creds.count()
+        deepgram_total = Credentials.objects.filter(credential_type=Credentials.CredentialTypes.DEEPGRAM).count()
 
         pipeline = {
             'recordings': {
-                'in_progress': Recording.objects.filter(state=RecordingStates.IN_PROGRESS).count(),
-                'completed_today': Recording.objects.filter(
-                    state=RecordingStates.COMPLETE,
-                    completed_at__date=today
-                ).count(),
-                'failed_today': Recording.objects.filter(
-                    state=RecordingStates.FAILED,
-                    updated_at__date=today
-                ).count()
+                'in_progress': recording_stats['in_progress'],
+                'completed_today': recording_stats['completed_today'],
+                'failed_today': recording_stats['failed_today'],
             },
             'transcriptions': {
-                'in_progress': Recording.objects.filter(
-                    transcription_state=RecordingTranscriptionStates.IN_PROGRESS
-                ).count(),
-                'pending_utterances': Utterance.objects.filter(
-                    transcription__isnull=True,
-                    failure_data__isnull=True
-                ).count(),
-                'failed_today': Recording.objects.filter(
-                    transcription_state=RecordingTranscriptionStates.FAILED,
-                    updated_at__date=today
-                ).count()
+                'in_progress': recording_stats['transcription_in_progress'],
+                'pending_utterances': utterance_stats['pending'],
+                'failed_today': recording_stats['transcription_failed_today'],
             },
             'async_transcriptions': {
-                'not_started': AsyncTranscription.objects.filter(
-                    state=AsyncTranscriptionStates.NOT_STARTED
-                ).count(),
-                'in_progress': AsyncTranscription.objects.filter(
-                    state=AsyncTranscriptionStates.IN_PROGRESS
-                ).count(),
-                'failed_today': AsyncTranscription.objects.filter(
-                    state=AsyncTranscriptionStates.FAILED,
-                    updated_at__date=today
-                ).count()
+                'not_started': async_stats['not_started'],
+                'in_progress': async_stats['in_progress'],
+                'failed_today': async_stats['failed_today'],
             },
             'deepgram': {
                 'credentials_configured': deepgram_total,
-                'utterances_completed_today': utterances_completed_today,
-                'utterances_failed_24h': failed_utterances_24h.count(),
+                'utterances_completed_today': utterance_stats['completed_today'],
+                'utterances_failed_24h': failed_utterances_count,
                 'failure_reasons_24h': failure_reasons
             },
             'timestamp': timezone.now().isoformat()
@@ -495,13 +606,13 @@ class PipelineActivityAPI(View):
             state=BotStates.ENDED,
             updated_at__date=today,
             meeting_url__isnull=False
-        ).exclude(meeting_url='').values_list('object_id', flat=True)
-        today_bot_ids = set(str(bid) for bid in today_ended_bots)
+        ).exclude(meeting_url='').values('object_id')
 
-        # Get today's activities for today's bots
+        # Get today's activities for today's bots; the bot filter stays in SQL
+        # as a subquery rather than a Python-built id set
         today_activities = PipelineActivity.objects.filter(
             created_at__date=today,
-            bot_id__in=today_bot_ids,
+            bot_id__in=today_ended_bots,
         )
 
         # Helper to count unique bots by final outcome
@@ -513,12 +624,11 @@ class PipelineActivityAPI(View):
                 latest_id=Max('id')
             ).values('latest_id')
 
-            final_outcomes = queryset.filter(id__in=Subquery(latest_per_bot))
-
-            return {
-                'success': final_outcomes.filter(status=PipelineActivity.Status.SUCCESS).count(),
-                'failed': final_outcomes.filter(status=PipelineActivity.Status.FAILED).count(),
-            }
+            # Both outcome counts from one pass over the latest-per-bot rows
+            return queryset.filter(id__in=Subquery(latest_per_bot)).aggregate(
+                success=Count('id', filter=Q(status=PipelineActivity.Status.SUCCESS)),
+                failed=Count('id', filter=Q(status=PipelineActivity.Status.FAILED)),
+            )
 
         # Filter by event type
         insight_extraction = today_activities.filter(
@@ -557,46 +667,53 @@ class ExternalIntegrationsAPI(View):
         day_ago = now - timedelta(hours=24)
 
         # Webhook stats
-        webhooks_24h = WebhookDeliveryAttempt.objects.filter(created_at__gte=day_ago)
-        success_count = webhooks_24h.filter(status=WebhookDeliveryAttemptStatus.SUCCESS).count()
-        total_count = webhooks_24h.count()
-        failed_count = webhooks_24h.filter(status=WebhookDeliveryAttemptStatus.FAILURE).count()
+        webhook_stats = WebhookDeliveryAttempt.objects.filter(created_at__gte=day_ago).aggregate(
+            total=Count('id'),
+            success=Count('id', filter=Q(status=WebhookDeliveryAttemptStatus.SUCCESS)),
+            failed=Count('id', filter=Q(status=WebhookDeliveryAttemptStatus.FAILURE)),
+        )
+        success_count = webhook_stats['success']
+        total_count = webhook_stats['total']
+        failed_count = webhook_stats['failed']
         pending_count = WebhookDeliveryAttempt.objects.filter(
             status=WebhookDeliveryAttemptStatus.PENDING
         ).count()
 
+        zoom_stats = ZoomOAuthConnection.objects.aggregate(
+            total=Count('id'),
+            connected=Count('id', filter=Q(state=ZoomOAuthConnectionStates.CONNECTED)),
+            disconnected=Count('id', filter=Q(state=ZoomOAuthConnectionStates.DISCONNECTED)),
+        )
+        # Per-provider credential counts, grouped in one query
+        credential_stats = {
+            row['provider']: row
+            for row in OAuthCredential.objects.filter(provider__in=['google', 'microsoft'])
+            .values('provider')
+            .annotate(
+                total=Count('id'),
+                valid=Count('id', filter=Q(token_expiry__gt=now)),
+                expired=Count('id', filter=Q(token_expiry__lte=now)),
+            )
+        }
+        google_stats = credential_stats.get('google', {})
+        microsoft_stats = credential_stats.get('microsoft', {})
+
         integrations = {
             'oauth': {
                 'zoom': {
-                    'total_connections': ZoomOAuthConnection.objects.count(),
-                    'connected': ZoomOAuthConnection.objects.filter(
-                        state=ZoomOAuthConnectionStates.CONNECTED
-                    ).count(),
-                    'disconnected': ZoomOAuthConnection.objects.filter(
-                        state=ZoomOAuthConnectionStates.DISCONNECTED
-                    ).count()
+                    'total_connections': zoom_stats['total'],
+                    'connected': zoom_stats['connected'],
+                    'disconnected': zoom_stats['disconnected'],
                 },
                 'google': {
-                    'total_credentials': OAuthCredential.objects.filter(provider='google').count(),
-                    'valid': OAuthCredential.objects.filter(
-                        provider='google',
-                        token_expiry__gt=now
-                    ).count(),
-                    'expired': OAuthCredential.objects.filter(
-                        provider='google',
-                        token_expiry__lte=now
-                    ).count()
+                    'total_credentials': google_stats.get('total', 0),
+                    'valid': google_stats.get('valid', 0),
+                    'expired': google_stats.get('expired', 0),
                 },
                 'microsoft': {
-                    'total_credentials': OAuthCredential.objects.filter(provider='microsoft').count(),
-                    'valid': OAuthCredential.objects.filter(
-                        provider='microsoft',
-                        token_expiry__gt=now
-                    ).count(),
-                    'expired': OAuthCredential.objects.filter(
-                        provider='microsoft',
-                        token_expiry__lte=now
-                    ).count()
+                    'total_credentials': microsoft_stats.get('total', 0),
+                    'valid': microsoft_stats.get('valid', 0),
+                    'expired': microsoft_stats.get('expired', 0),
                 }
             },
             'webhooks': {
@@ -8,7 +8,7 @@ from django.utils.decorators import method_decorator
 from django.views import View
 from django.views.decorators.csrf import csrf_exempt
 
-from bots.tasks.sync_calendar_task import enqueue_sync_calendar_task
+from bots.domain_wide.tasks import enqueue_google_webhook_task
 
 logger = logging.getLogger(__name__)
 
@@ -30,9 +30,6 @@ class GoogleCalendarWebhook(View):
 
         logger.info(f"Google Calendar webhook: channel={channel_id}, state={resource_state}")
 
-        # Respond immediately - Google expects quick response
-        # Process async to avoid timeout
-
         # Ignore sync confirmations (sent when channel is created)
         if resource_state == 'sync':
             logger.debug("Ignoring sync confirmation")
@@ -42,27 +39,8 @@ class GoogleCalendarWebhook(View):
             logger.warning("Missing channel_id in Google webhook")
             return HttpResponse('Missing channel ID', status=400)
 
-        # Look up which calendar this webhook is for
-        try:
-            from ..models import GoogleWatchChannel
-            watch_channel = GoogleWatchChannel.objects.filter(channel_id=channel_id).first()
-
-            if not watch_channel:
-                logger.warning(f"Unknown channel {channel_id}, ignoring webhook")
-                return HttpResponse('OK', status=200)
-
-            # Get the calendar and trigger sync
-            calendar = watch_channel.calendar
-            if calendar:
-                logger.info(f"Triggering sync for {watch_channel.user_email} (calendar {calendar.object_id})")
-                # Trigger async sync task
-                enqueue_sync_calendar_task(calendar)
-            else:
-                logger.warning(f"No calendar linked to watch channel for {watch_channel.user_email}")
-
-        except Exception as e:
-            logger.exception(f"Error processing Google webhook: {e}")
-            # Still return 200 to prevent Google from retrying
-            return HttpResponse('OK', status=200)
+        # Respond immediately - Google expects quick response and retries
+        # slow deliveries, so the lookup and enqueue run as a task
+        enqueue_google_webhook_task(channel_id)
 
         return HttpResponse('OK', status=200)
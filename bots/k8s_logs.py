@@ -21,12 +21,69 @@ Usage:
 """
 
 import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime
 from typing import Generator, List, Optional
 
 from django.conf import settings
+from django.core.cache import cache
 
 logger = logging.getLogger(__name__)
 
+# Label set on every bot pod by BotPodCreator
+_BOT_POD_LABEL_SELECTOR = 'app=bot-proc'
+
+# Let the apiserver drop finished pods instead of shipping their specs to us
+_ACTIVE_POD_FIELD_SELECTOR = 'status.phase!=Succeeded,status.phase!=Failed'
+
+# Bot pod listings are shared between callers for this long, absorbing
+# bursts of dashboard polls
+_BOT_PODS_CACHE_TTL_SECONDS = 3
+
+# How long a caller that lost the refresh race waits for the winner's
+# result before listing the pods itself
+_BOT_PODS_LOCK_TTL_SECONDS = 10
+_BOT_PODS_WAIT_SECONDS = 2
+_BOT_PODS_POLL_INTERVAL_SECONDS = 0.1
+
+
+@dataclass(frozen=True, slots=True)
+class PodInfo:
+    """Summary of a bot pod as returned by K8sLogStreamer.list_bot_pods.
+
+    Attributes:
+        name: Pod name
+        status: Pod phase (Running, Pending, ...)
+        creation_timestamp: Pod creation time as reported by the apiserver
+        bot_id: Bot object ID parsed from the pod name (bot-{object_id})
+        node: Node the pod is scheduled on, if any
+        containers: Names of the pod's containers
+    """
+
+    name: str
+    status: str
+    creation_timestamp: datetime | None
+    bot_id: str | None
+    node: str | None
+    containers: tuple[str, ...]
+
+    @property
+    def created_at(self) -> str | None:
+        """Creation time as an ISO 8601 string, formatted on access."""
+        return self.creation_timestamp.isoformat() if self.creation_timestamp else None
+
+    def to_dict(self) -> dict:
+        """Dictionary form for JSON responses."""
+        return {
+            'name': self.name,
+            'status': self.status,
+            'created_at': self.created_at,
+            'bot_id': self.bot_id,
+            'node': self.node,
+            'containers': list(self.containers),
+        }
+
 
 def _init_kubernetes_client():
     """Initialize and return Kubernetes CoreV1Api client."""
@@ -67,7 +124,7 @@ class K8sLogStreamer:
             self._v1 = _init_kubernetes_client()
         return self._v1
 
-    def list_bot_pods(self, include_terminated: bool = False) -> List[dict]:
+    def list_bot_pods(self, include_terminated: bool = False) -> List[PodInfo]:
         """
         List all bot pods in the namespace.
 
@@ -75,40 +132,72 @@ class K8sLogStreamer:
             include_terminated: If True, include pods that are not Running.
 
         Returns:
-            List of pod info dictionaries with keys: name, status, created_at, bot_id
+            List of PodInfo, newest first.
         """
-        try:
-            pods = self.v1.list_namespaced_pod(namespace=self.namespace)
-
-            bot_pods = []
-            for pod in pods.items:
-                # Filter to only bot pods (name starts with 'bot-')
-                if not pod.metadata.name.startswith('bot-'):
-                    continue
-
-                status = pod.status.phase
-                if not include_terminated and status not in ['Running', 'Pending']:
-                    continue
-
-                # Extract bot ID from pod name (format: bot-{object_id})
-                bot_id = pod.metadata.name.replace('bot-', '', 1) if pod.metadata.name.startswith('bot-') else None
-
-                bot_pods.append({
-                    'name': pod.metadata.name,
-                    'status': status,
-                    'created_at': pod.metadata.creation_timestamp.isoformat() if pod.metadata.creation_timestamp else None,
-                    'bot_id': bot_id,
-                    'node': pod.spec.node_name,
-                    'containers': [c.name for c in pod.spec.containers] if pod.spec.containers else [],
-                })
-
-            # Sort by creation time, newest first
-            bot_pods.sort(key=lambda x: x['created_at'] or '', reverse=True)
-            return bot_pods
+        cache_key = f"k8s:bot_pods:{self.namespace}:{int(include_terminated)}"
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Single-flight: only the caller that takes the lock lists the pods,
+        # the rest wait briefly for its result
+        lock_key = f"{cache_key}:lock"
+        acquired = cache.add(lock_key, 1, _BOT_PODS_LOCK_TTL_SECONDS)
+        if not acquired:
+            deadline = time.monotonic() + _BOT_PODS_WAIT_SECONDS
+            while time.monotonic() < deadline:
+                time.sleep(_BOT_PODS_POLL_INTERVAL_SECONDS)
+                cached = cache.get(cache_key)
+                if cached is not None:
+                    return cached
 
+        try:
+            bot_pods = self._fetch_bot_pods(include_terminated)
         except Exception as e:
             logger.error(f"Failed to list bot pods: {e}")
             return []
+        finally:
+            if acquired:
+                cache.delete(lock_key)
+
+        cache.set(cache_key, bot_pods, _BOT_PODS_CACHE_TTL_SECONDS)
+        return bot_pods
+
+    def _fetch_bot_pods(self, include_terminated: bool) -> List[PodInfo]:
+        """List bot pods from the apiserver, bypassing the cache."""
+        list_kwargs = {'label_selector': _BOT_POD_LABEL_SELECTOR}
+        if not include_terminated:
+            list_kwargs['field_selector'] = _ACTIVE_POD_FIELD_SELECTOR
+        pods = self.v1.list_namespaced_pod(namespace=self.namespace, **list_kwargs)
+
+        bot_pods = []
+        for pod in pods.items:
+            # Filter to only bot pods (name starts with 'bot-')
+            if not pod.metadata.name.startswith('bot-'):
+                continue
+
+            status = pod.status.phase
+            if not include_terminated and status not in ['Running', 'Pending']:
+                continue
+
+            # Extract bot ID from pod name (format: bot-{object_id})
+            bot_id = pod.metadata.name.replace('bot-', '', 1) if pod.metadata.name.startswith('bot-') else None
+
+            bot_pods.append(PodInfo(
+                name=pod.metadata.name,
+                status=status,
+                creation_timestamp=pod.metadata.creation_timestamp,
+                bot_id=bot_id,
+                node=pod.spec.node_name,
+                containers=tuple(c.name for c in pod.spec.containers) if pod.spec.containers else (),
+            ))
+
+        # Sort by creation time, newest first; pods without one go last
+        bot_pods.sort(
+            key=lambda p: (p.creation_timestamp is not None, p.creation_timestamp or 0),
+            reverse=True,
+        )
+        return bot_pods
 
     def get_pod_logs(
         self,
@@ -230,7 +319,7 @@ class K8sLogStreamer:
             return None
 
 
-def list_running_bot_pods() -> List[dict]:
+def list_running_bot_pods() -> List[PodInfo]:
     """Convenience function to list running bot pods."""
     return K8sLogStreamer().list_bot_pods(include_terminated=False)
 
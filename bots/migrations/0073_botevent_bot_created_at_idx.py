@@ -0,0 +1,20 @@
+# Generated manually to index BotEvent lookups by bot, newest first
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY can't run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('bots', '0072_botactivitylog'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='botevent',
+            index=models.Index(fields=['bot', '-created_at'], name='bot_event_bot_created_at_idx'),
+        ),
+    ]
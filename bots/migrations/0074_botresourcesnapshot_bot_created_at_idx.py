@@ -0,0 +1,20 @@
+# Generated manually to index BotResourceSnapshot lookups by bot and time
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY can't run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('bots', '0073_botevent_bot_created_at_idx'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='botresourcesnapshot',
+            index=models.Index(fields=['bot', 'created_at'], name='bot_res_snap_bot_created_idx'),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated manually to index recently failed utterances
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY can't run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('bots', '0074_botresourcesnapshot_bot_created_at_idx'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='utterance',
+            index=models.Index(condition=models.Q(('failure_data__isnull', False)), fields=['updated_at'], name='utterance_failed_updated_idx'),
+        ),
+    ]
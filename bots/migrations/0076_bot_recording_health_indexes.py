@@ -0,0 +1,28 @@
+# Generated manually to index the system health dashboard's Bot and Recording filters
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY can't run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('bots', '0075_utterance_failed_updated_idx'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='bot',
+            index=models.Index(fields=['state', 'updated_at'], name='bot_state_updated_at_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='bot',
+            index=models.Index(condition=models.Q(('last_heartbeat_timestamp__isnull', False)), fields=['last_heartbeat_timestamp'], name='bot_hb_partial_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='recording',
+            index=models.Index(fields=['state', 'transcription_state', 'updated_at'], name='rec_state_trans_updated_idx'),
+        ),
+    ]
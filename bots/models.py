@@ -997,6 +997,10 @@ class Bot(models.Model):
         # The partial index will exclude bots without a join_at which should speed up the query and reduce the space used by the index.
         indexes = [
             models.Index(fields=["join_at"], name="bot_join_at_idx", condition=models.Q(join_at__isnull=False)),
+            # Stuck-bot and ended-today lookups on the system health dashboard
+            models.Index(fields=["state", "updated_at"], name="bot_state_updated_at_idx"),
+            # Heartbeat timeout checks only look at bots that have sent a heartbeat
+            models.Index(fields=["last_heartbeat_timestamp"], name="bot_hb_partial_idx", condition=models.Q(last_heartbeat_timestamp__isnull=False)),
         ]
 
         # Within a project, we don't want to allow bots that aren't in apost-meeting state with the same deduplication key.
@@ -1322,6 +1326,9 @@ class BotEvent(models.Model):
                 name="valid_event_type_event_sub_type_combinations",
             )
         ]
+        indexes = [
+            models.Index(fields=["bot", "-created_at"], name="bot_event_bot_created_at_idx"),
+        ]
 
 
 class BotEventTransitionFunctions:
@@ -2051,6 +2058,12 @@ class Recording(models.Model):
 
     file = models.FileField(storage=RecordingStorage())
 
+    class Meta:
+        indexes = [
+            # Pipeline and stuck-transcription checks on the system health dashboard
+            models.Index(fields=["state", "transcription_state", "updated_at"], name="rec_state_trans_updated_idx"),
+        ]
+
     def __str__(self):
         return f"Recording for {self.bot.object_id}"
 
@@ -2409,6 +2422,12 @@ class Utterance(models.Model):
     audio_format = models.IntegerField(choices=AudioFormat.choices, default=AudioFormat.PCM, null=True)
     sample_rate = models.IntegerField(null=True, default=None)
 
+    class Meta:
+        indexes = [
+            # Recent failures for the processing pipeline dashboard
+            models.Index(fields=["updated_at"], name="utterance_failed_updated_idx", condition=models.Q(failure_data__isnull=False)),
+        ]
+
     def __str__(self):
         return f"Utterance at {self.timestamp_ms}ms ({self.duration_ms}ms long)"
 
@@ -2924,6 +2943,11 @@ class BotResourceSnapshot(models.Model):
     data = models.JSONField(null=False, default=dict)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["bot", "created_at"], name="bot_res_snap_bot_created_idx"),
+        ]
+
     def __str__(self):
         return f"Resource snapshot for {self.bot.object_id} at {self.created_at}"
 
@@ -18,6 +18,8 @@ Usage:
     task_executor.apply_async(my_sync_function, args=(arg1,), countdown=60)
 """
 
+import heapq
+import itertools
 import logging
 import threading
 import time
@@ -35,25 +37,31 @@ class TaskExecutor:
     """
 
     _instance = None
-    _lock = threading.Lock()
+    # Guards singleton construction only; delayed tasks use _delayed_cond
+    _instance_lock = threading.Lock()
 
-    def __new__(cls):
+    def __new__(cls, max_workers: int = 10):
         if cls._instance is None:
-            with cls._lock:
+            with cls._instance_lock:
                 if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-                    cls._instance._initialized = False
+                    instance = super().__new__(cls)
+                    instance._setup(max_workers)
+                    cls._instance = instance
         return cls._instance
 
-    def __init__(self, max_workers: int = 10):
-        if self._initialized:
-            return
-
+    def _setup(self, max_workers: int):
+        """
+        One-time initialisation, run under _instance_lock in __new__ so that
+        concurrent first calls can't both start a pool and delay thread.
+        """
         self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="task_executor")
+        # Min-heap of (scheduled_time, seq, func, args, kwargs); seq keeps
+        # ordering stable for equal times without comparing the callables
         self._delayed_tasks = []
+        self._delayed_seq = itertools.count()
+        self._delayed_cond = threading.Condition()
         self._delay_thread = None
         self._shutdown = False
-        self._initialized = True
 
         # Start the delay processor thread
         self._start_delay_processor()
@@ -64,41 +72,46 @@ class TaskExecutor:
         """Start background thread to process delayed tasks."""
         def process_delayed():
             while not self._shutdown:
-                now = time.time()
                 tasks_to_run = []
 
-                with self._lock:
-                    remaining = []
-                    for scheduled_time, func, args, kwargs in self._delayed_tasks:
-                        if now >= scheduled_time:
-                            tasks_to_run.append((func, args, kwargs))
-                        else:
-                            remaining.append((scheduled_time, func, args, kwargs))
-                    self._delayed_tasks = remaining
+                with self._delayed_cond:
+                    # Sleep until the earliest task is due or a new one is scheduled
+                    while not self._shutdown:
+                        timeout = None
+                        if self._delayed_tasks:
+                            timeout = self._delayed_tasks[0][0] - time.time()
+                            if timeout <= 0:
+                                break
+                        self._delayed_cond.wait(timeout)
 
-                for func, args, kwargs in tasks_to_run:
-                    self.submit(func, *args, **kwargs)
+                    now = time.time()
+                    while self._delayed_tasks and self._delayed_tasks[0][0] <= now:
+                        _, _, func, args, kwargs = heapq.heappop(self._delayed_tasks)
+                        tasks_to_run.append((func, args, kwargs))
 
-                time.sleep(1)  # Check every second
+                for task in tasks_to_run:
+                    self._executor.submit(self._run_task, *task)
 
         self._delay_thread = threading.Thread(target=process_delayed, daemon=True, name="task_executor_delay")
         self._delay_thread.start()
 
     def submit(self, func: Callable, *args, **kwargs) -> None:
         """Submit a task for immediate execution."""
-        def wrapped_task():
-            from django.db import close_old_connections
-            try:
-                close_old_connections()  # Ensure fresh DB connection for thread
-                logger.info(f"Executing task: {func.__name__}")
-                func(*args, **kwargs)
-                logger.info(f"Task completed: {func.__name__}")
-            except Exception as e:
-                logger.exception(f"Task failed: {func.__name__}: {e}")
-            finally:
-                close_old_connections()  # Clean up connection after task
-
-        self._executor.submit(wrapped_task)
+        self._executor.submit(self._run_task, func, args, kwargs)
+
+    @staticmethod
+    def _run_task(func: Callable, args: Tuple, kwargs: dict) -> None:
+        """Run a task on a worker thread with fresh DB connections, logging failures."""
+        from django.db import close_old_connections
+        try:
+            close_old_connections()  # Ensure fresh DB connection for thread
+            logger.info(f"Executing task: {func.__name__}")
+            func(*args, **kwargs)
+            logger.info(f"Task completed: {func.__name__}")
+        except Exception as e:
+            logger.exception(f"Task failed: {func.__name__}: {e}")
+        finally:
+            close_old_connections()  # Clean up connection after task
 
     def submit_delayed(self, func: Callable, countdown: int, args: Tuple = (), kwargs: dict = None) -> None:
         """Submit a task to be executed after countdown seconds."""
@@ -106,8 +119,10 @@ class TaskExecutor:
             kwargs = {}
 
         scheduled_time = time.time() + countdown
-        with self._lock:
-            self._delayed_tasks.append((scheduled_time, func, args, kwargs))
+        with self._delayed_cond:
+            heapq.heappush(self._delayed_tasks, (scheduled_time, next(self._delayed_seq), func, args, kwargs))
+            # Wake the processor in case this is now the earliest task
+            self._delayed_cond.notify()
 
         logger.debug(f"Scheduled task {func.__name__} to run in {countdown} seconds")
 
@@ -127,7 +142,9 @@ class TaskExecutor:
 
     def shutdown(self, wait: bool = True):
         """Shutdown the executor."""
-        self._shutdown = True
+        with self._delayed_cond:
+            self._shutdown = True
+            self._delayed_cond.notify()
         self._executor.shutdown(wait=wait)
         logger.info("TaskExecutor shutdown complete")
 
@@ -0,0 +1,62 @@
+import threading
+import time
+
+from django.test import SimpleTestCase
+
+from bots.task_executor import TaskExecutor, task_executor
+
+
+class TaskExecutorDelayedTasksTest(SimpleTestCase):
+    def setUp(self):
+        # A private instance, so shutting it down doesn't affect the singleton
+        self.executor = object.__new__(TaskExecutor)
+        self.executor._setup(max_workers=2)
+        self.addCleanup(self.executor.shutdown)
+
+    def test_delayed_tasks_run_in_due_order(self):
+        """Tasks submitted out of order run in order of their countdown"""
+        ran = []
+        done = threading.Event()
+
+        def record(name):
+            ran.append(name)
+            if len(ran) == 3:
+                done.set()
+
+        self.executor.submit_delayed(record, countdown=0.3, args=("third",))
+        self.executor.submit_delayed(record, countdown=0.1, args=("first",))
+        self.executor.submit_delayed(record, countdown=0.2, args=("second",))
+
+        self.assertTrue(done.wait(timeout=5))
+        self.assertEqual(ran, ["first", "second", "third"])
+
+    def test_earlier_task_wakes_waiting_processor(self):
+        """A newly scheduled earlier task runs without waiting for the later one"""
+        ran = threading.Event()
+
+        self.executor.submit_delayed(lambda: None, countdown=60)
+        # Let the processor settle into its wait for the 60s task
+        time.sleep(0.1)
+
+        start = time.monotonic()
+        self.executor.submit_delayed(ran.set, countdown=0.05)
+
+        self.assertTrue(ran.wait(timeout=5))
+        self.assertLess(time.monotonic() - start, 2)
+
+    def test_shutdown_stops_delay_thread(self):
+        """shutdown() wakes the idle processor so its thread exits"""
+        self.executor.submit_delayed(lambda: None, countdown=60)
+        time.sleep(0.1)
+
+        self.executor.shutdown()
+        self.executor._delay_thread.join(timeout=5)
+
+        self.assertFalse(self.executor._delay_thread.is_alive())
+
+
+class TaskExecutorSingletonTest(SimpleTestCase):
+    def test_constructor_returns_singleton(self):
+        """TaskExecutor() returns the module instance regardless of arguments"""
+        self.assertIs(TaskExecutor(), task_executor)
+        self.assertIs(TaskExecutor(max_workers=3), task_executor)
@@ -163,13 +163,16 @@ def format_date(date_str: str) -> str:
         return 'Unknown date'
 
 
+_R2_URL_RE = re.compile(r'r2\.cloudflarestorage\.com/[^/]+/(.+)$')
+
+
 def get_public_video_url(recording_url: str) -> str:
     """Transform private R2 URL to public URL if needed."""
     if not recording_url:
         return ''
 
     # Check for R2 URL pattern
-    match = re.search(r'r2\.cloudflarestorage\.com/[^/]+/(.+)$', recording_url)
+    match = _R2_URL_RE.search(recording_url)
     if match:
         return f"https://pub-b4590a75005946ca8c543dc5efb61b28.r2.dev/{match.group(1)}"
 
@@ -270,13 +273,14 @@ def transcript_view(request, meeting_id):
 
     # Build transcript HTML
     # Note: Supabase transcript uses 'speaker' and 'timestamp_ms', not 'speaker_name' and 'start_ms'
+    # Speakers get colors in order of first appearance, in the same pass
     transcript = meeting.get('transcript') or []
-    speakers = list(set(seg.get('speaker') or seg.get('speaker_name', 'Unknown') for seg in transcript))
-    speaker_colors = {speaker: idx % 8 for idx, speaker in enumerate(speakers)}
+    speaker_colors = {}
 
     transcript_segments = []
     for idx, seg in enumerate(transcript):
         speaker = seg.get('speaker') or seg.get('speaker_name', 'Unknown')
+        color = speaker_colors.setdefault(speaker, len(speaker_colors) % 8)
         start_ms = seg.get('timestamp_ms') or seg.get('start_ms', 0)
         duration_ms = seg.get('duration_ms', 0)
         end_ms = start_ms + duration_ms if duration_ms else start_ms
@@ -285,7 +289,7 @@ def transcript_view(request, meeting_id):
             'text': seg.get('text', ''),
             'start_ms': start_ms,
             'end_ms': end_ms,
-            'color_class': f"speaker-color-{speaker_colors.get(speaker, 0)}",
+            'color_class': f"speaker-color-{color}",
             'timestamp': format_timestamp(start_ms),
             'index': idx,
         })